@@ -189,7 +189,7 @@ many "missing" systems are valid omissions and not defects.
         Returns:
             Formatted JSON string
         """
-        import json
+        from megaprompt.core import serialization
 
-        return json.dumps(report.model_dump(), indent=2, default=str)
+        return serialization.dumps(report.model_dump(), default=str)
 
@@ -9,11 +9,6 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
-try:
-    import yaml
-except ImportError:
-    yaml = None  # yaml is optional
-
 from megaprompt.schemas.analysis import CodebaseStructure
 
 # Set up logger
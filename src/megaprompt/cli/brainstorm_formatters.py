@@ -1,8 +1,8 @@
 """Formatters for brainstorm output."""
 
-import json
 from typing import Any
 
+from megaprompt.core import serialization
 from megaprompt.schemas.brainstorm import BrainstormResult, ProjectIdea
 
 
@@ -87,13 +87,7 @@ def format_json(result: BrainstormResult) -> str:
     Returns:
         JSON formatted string
     """
-    return json.dumps(
-        {
-            "seed_prompt": result.seed_prompt,
-            "ideas": [idea.model_dump() for idea in result.ideas],
-            "metadata": result.metadata,
-        },
-        indent=2,
-        ensure_ascii=False,
-    )
+    # One model_dump walks the whole tree in pydantic-core, rather than
+    # dumping each idea separately and rebuilding the envelope by hand
+    return serialization.dumps(result.model_dump())
 
@@ -2,8 +2,11 @@
 
 import json
 import sys
+from functools import lru_cache
 from typing import Any, Optional
 
+from megaprompt.core import serialization
+
 try:
     from rich.console import Console
     from rich.json import JSON
@@ -25,14 +28,24 @@ except ImportError:
     RICH_AVAILABLE = False
 
 
+def _dumps_indented(data: Any, indent: int) -> str:
+    """JSON-encode data, using orjson for the common 2-space indent."""
+    if indent == 2:
+        return serialization.dumps(data)
+    return json.dumps(data, indent=indent, ensure_ascii=False)
+
+
 class OutputFormatter:
     """Formats output with optional rich support."""
 
-    def __init__(self, use_rich: bool = True, force_color: bool = False):
-        """Initialize formatter."""
+    def __init__(self, use_rich: bool = True, force_color: Optional[bool] = False):
+        """Initialize formatter (force_color=None auto-detects a terminal)."""
         self.use_rich = use_rich and RICH_AVAILABLE
         if self.use_rich:
-            self.console = Console(force_terminal=force_color, file=sys.stdout)
+            # No explicit file: Rich resolves sys.stdout at write time, so a
+            # reused formatter follows stream redirection
+            self.console = Console(force_terminal=force_color)
+            self.error_console = Console(force_terminal=force_color, stderr=True)
             self.progress = Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
@@ -43,11 +56,12 @@ class OutputFormatter:
             )
         else:
             self.console = None
+            self.error_console = None
             self.progress = None
 
     def format_json(self, data: Any, indent: int = 2) -> str:
         """Format JSON with syntax highlighting if rich is available."""
-        json_str = json.dumps(data, indent=indent, ensure_ascii=False)
+        json_str = _dumps_indented(data, indent)
         if self.use_rich:
             return str(JSON(json_str))
         return json_str
@@ -61,9 +75,9 @@ class OutputFormatter:
     def print_json(self, data: Any, indent: int = 2) -> None:
         """Print JSON with syntax highlighting."""
         if self.use_rich:
-            self.console.print(JSON(json.dumps(data, indent=indent, ensure_ascii=False)))
+            self.console.print(JSON(_dumps_indented(data, indent)))
         else:
-            print(json.dumps(data, indent=indent, ensure_ascii=False))
+            print(_dumps_indented(data, indent))
 
     def print_markdown(self, text: str) -> None:
         """Print markdown with rich rendering."""
@@ -100,7 +114,7 @@ class OutputFormatter:
     def print_error(self, message: str) -> None:
         """Print error message."""
         if self.use_rich:
-            self.console.print(f"[red]✗[/red] {message}", file=sys.stderr)
+            self.error_console.print(f"[red]✗[/red] {message}")
         else:
             print(f"✗ {message}", file=sys.stderr)
 
@@ -117,6 +131,13 @@ class OutputFormatter:
             self.console.print(f"[blue]ℹ[/blue] {message}")
         else:
             print(f"ℹ {message}")
+
+    def print_info_lines(self, messages: list[str]) -> None:
+        """Print several info messages, one per line, in a single write."""
+        if self.use_rich:
+            self.console.print("\n".join(f"[blue]ℹ[/blue] {message}" for message in messages))
+        else:
+            print("\n".join(f"ℹ {message}" for message in messages))
     
     def print_stage_header(self, stage_num: int, stage_name: str, description: str = "") -> None:
         """Print a stage header with formatting."""
@@ -168,32 +189,41 @@ def estimate_tokens(text: str) -> int:
     return len(text) // 4
 
 
-def estimate_cost(tokens: int, provider: str, model: Optional[str] = None) -> Optional[float]:
-    """Estimate cost based on provider and model (rough estimates)."""
-    # Rough cost estimates per 1K tokens
-    cost_estimates = {
-        "ollama": 0.0,  # Local, free
-        "gemini": {
-            "gemini-2.5-flash": 0.0,  # Free tier
-            "gemini-3-flash": 0.0,  # Free tier
-            "default": 0.0,
-        },
-        "qwen": {
-            "qwen-plus": 0.008,  # ~$0.008 per 1K tokens
-            "qwen-turbo": 0.002,
-            "qwen-max": 0.02,
-            "default": 0.008,
-        },
-    }
-
-    if provider not in cost_estimates:
+# Rough cost estimates per 1K tokens
+_COST_ESTIMATES: dict[str, Any] = {
+    "ollama": 0.0,  # Local, free
+    "gemini": {
+        "gemini-2.5-flash": 0.0,  # Free tier
+        "gemini-3-flash": 0.0,  # Free tier
+        "default": 0.0,
+    },
+    "qwen": {
+        "qwen-plus": 0.008,  # ~$0.008 per 1K tokens
+        "qwen-turbo": 0.002,
+        "qwen-max": 0.02,
+        "default": 0.008,
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _cost_per_1k(provider: str, model: Optional[str]) -> Optional[float]:
+    """Resolve the per-1K-token rate for a provider/model pair."""
+    if provider not in _COST_ESTIMATES:
         return None
 
-    provider_cost = cost_estimates[provider]
+    provider_cost = _COST_ESTIMATES[provider]
     if isinstance(provider_cost, dict):
-        cost_per_1k = provider_cost.get(model, provider_cost.get("default", 0.0))
-    else:
-        cost_per_1k = provider_cost
+        return provider_cost.get(model, provider_cost.get("default", 0.0))
+    return provider_cost
 
-    return (tokens / 1000) * cost_per_1k
 
+def estimate_cost(tokens: int, provider: str, model: Optional[str] = None) -> Optional[float]:
+    """Estimate cost based on provider and model (rough estimates)."""
+    # Local models are free, so skip the pricing lookup for them
+    if provider == "ollama":
+        return 0.0
+    cost_per_1k = _cost_per_1k(provider, model)
+    if cost_per_1k is None:
+        return None
+    return (tokens / 1000) * cost_per_1k
@@ -8,19 +8,32 @@ import click
 
 from megaprompt.core.config import Config
 
+# Environment variables holding API keys for providers that require one
+_PROVIDER_ENV_VARS = {
+    "qwen": "QWEN_API_KEY",
+    "gemini": "GEMINI_API_KEY",
+}
+
+# Rich styling is only useful when a terminal is attached
+_INTERACTIVE = sys.stdout.isatty()
+
+# Constant UI strings
+_SEPARATOR = "=" * 50
+_HEADER_RICH = "\n[bold cyan]Interactive Configuration[/bold cyan]"
+_HEADER_PLAIN = "\nInteractive Configuration"
+_DONE_RICH = "\n[green]✓[/green] Configuration complete!"
+_DONE_PLAIN = "\n✓ Configuration complete!"
+
 
 def prompt_provider(default: str = "auto") -> str:
     """Prompt for LLM provider with validation."""
-    while True:
-        provider = click.prompt(
-            "LLM Provider",
-            type=click.Choice(["auto", "ollama", "qwen", "gemini"], case_sensitive=False),
-            default=default,
-            show_choices=True,
-        )
-        if provider:
-            return provider.lower()
-        click.echo("Please select a valid provider.", err=True)
+    # Choices are lowercase; click returns the canonical choice, so no .lower()
+    return click.prompt(
+        "LLM Provider",
+        type=click.Choice(["auto", "ollama", "qwen", "gemini"], case_sensitive=False),
+        default=default,
+        show_choices=True,
+    )
 
 
 def prompt_model(provider: str, default: Optional[str] = None) -> Optional[str]:
@@ -59,21 +72,12 @@ def prompt_api_key(provider: str, env_var: Optional[str] = None) -> Optional[str
 
 def prompt_temperature(default: float = 0.0) -> float:
     """Prompt for temperature with validation."""
-    while True:
-        try:
-            temp = click.prompt(
-                "Temperature",
-                type=float,
-                default=default,
-                show_default=True,
-            )
-            if 0.0 <= temp <= 2.0:
-                return temp
-            click.echo("Temperature must be between 0.0 and 2.0", err=True)
-        except click.Abort:
-            raise
-        except Exception:
-            click.echo("Invalid temperature value. Please enter a number.", err=True)
+    return click.prompt(
+        "Temperature",
+        type=click.FloatRange(0.0, 2.0),
+        default=default,
+        show_default=True,
+    )
 
 
 def prompt_output_format(default: str = "markdown") -> str:
@@ -112,6 +116,19 @@ def confirm_action(message: str, default: bool = False) -> bool:
     return click.confirm(message, default=default)
 
 
+def _print_styled(markup: str, plain: str) -> None:
+    """Print Rich markup on a terminal, falling back to plain text."""
+    if _INTERACTIVE:
+        try:
+            from rich.console import Console
+        except ImportError:
+            pass
+        else:
+            Console().print(markup)
+            return
+    click.echo(plain)
+
+
 def interactive_config(config: Config, skip_confirmations: bool = False) -> Config:
     """
     Interactively configure missing settings.
@@ -123,14 +140,8 @@ def interactive_config(config: Config, skip_confirmations: bool = False) -> Conf
     Returns:
         Updated configuration object
     """
-    try:
-        from rich.console import Console
-        console = Console()
-        console.print("\n[bold cyan]Interactive Configuration[/bold cyan]")
-        console.print("=" * 50)
-    except ImportError:
-        click.echo("\nInteractive Configuration")
-        click.echo("=" * 50)
+    _print_styled(_HEADER_RICH, _HEADER_PLAIN)
+    click.echo(_SEPARATOR)
     
     # Provider
     if not config.provider or config.provider == "auto":
@@ -145,14 +156,9 @@ def interactive_config(config: Config, skip_confirmations: bool = False) -> Conf
             config.model = prompt_model(config.provider)
     
     # API Key (if needed)
-    if config.provider in ["qwen", "gemini"]:
-        env_vars = {
-            "qwen": "QWEN_API_KEY",
-            "gemini": "GEMINI_API_KEY",
-        }
-        env_var = env_vars.get(config.provider)
-        if not config.api_key and not skip_confirmations:
-            config.api_key = prompt_api_key(config.provider, env_var)
+    env_var = _PROVIDER_ENV_VARS.get(config.provider)
+    if env_var and not config.api_key and not skip_confirmations:
+        config.api_key = prompt_api_key(config.provider, env_var)
     
     # Temperature
     if config.temperature == 0.0 and not skip_confirmations:
@@ -164,12 +170,7 @@ def interactive_config(config: Config, skip_confirmations: bool = False) -> Conf
         if click.confirm("  Customize output format?", default=False):
             config.output_format = prompt_output_format(config.output_format)
     
-    try:
-        from rich.console import Console
-        console = Console()
-        console.print("\n[green]✓[/green] Configuration complete!")
-    except ImportError:
-        click.echo("\n✓ Configuration complete!")
+    _print_styled(_DONE_RICH, _DONE_PLAIN)
     return config
 
 
@@ -177,14 +178,9 @@ def prompt_missing_config(config: Config) -> Config:
     """Prompt for missing critical configuration."""
     missing = []
     
-    if config.provider in ["qwen", "gemini"] and not config.api_key:
-        env_vars = {
-            "qwen": "QWEN_API_KEY",
-            "gemini": "GEMINI_API_KEY",
-        }
-        env_var = env_vars.get(config.provider)
-        if not os.getenv(env_var):
-            missing.append(f"API key for {config.provider}")
+    env_var = _PROVIDER_ENV_VARS.get(config.provider)
+    if env_var and not config.api_key and not os.getenv(env_var):
+        missing.append(f"API key for {config.provider}")
     
     if missing:
         click.echo("\n[yellow]⚠[/yellow] Missing configuration:")
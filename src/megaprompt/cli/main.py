@@ -1,25 +1,28 @@
 """CLI interface for Mega-Prompt Generator."""
 
-import glob
+import fnmatch
 import json
+import mmap
 import os
+import re
+import stat
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import cache, lru_cache
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
-import yaml
 
-from megaprompt.cli.formatters import OutputFormatter, estimate_cost, estimate_tokens
-from megaprompt.cli.interactive import (
-    confirm_overwrite,
-    interactive_config,
-    prompt_missing_config,
-)
+from megaprompt.core import serialization
 from megaprompt.core.config import Config
-from megaprompt.core.pipeline import MegaPromptPipeline
+
+if TYPE_CHECKING:
+    from megaprompt.cli.formatters import OutputFormatter
 
 
 @click.group()
@@ -151,7 +154,13 @@ def main():
     "-w",
     type=int,
     default=None,
-    help="Number of parallel workers for batch processing (default: number of CPUs)",
+    help="Number of parallel workers for batch processing (default: number of available CPUs)",
+)
+@click.option(
+    "--pool",
+    type=click.Choice(["thread", "process"], case_sensitive=False),
+    default="thread",
+    help="Executor for batch processing: thread for LLM-bound work, process for CPU-bound formatting (default: thread)",
 )
 @click.option(
     "--output-dir",
@@ -232,6 +241,7 @@ def generate(
     color: bool | None,
     batch: bool,
     workers: int | None,
+    pool: str,
     output_dir: str | None,
     interactive: bool,
     yes: bool,
@@ -293,12 +303,29 @@ def generate(
         if config_path.exists():
             config_obj._load_file(config_path, config_obj)
 
-    # Handle batch processing
-    if batch or "*" in input_source or "?" in input_source:
+    # Setup checkpoint and cache directories
+    checkpoint_path = None
+    if resume or checkpoint_dir:
+        if checkpoint_dir:
+            checkpoint_path = Path(checkpoint_dir)
+        else:
+            checkpoint_path = config_obj.get_checkpoint_dir()
+
+    cache_path = None
+    if not no_cache:
+        if cache_dir:
+            cache_path = Path(cache_dir)
+        else:
+            cache_path = config_obj.get_cache_dir()
+
+    # Handle batch processing. An existing file is read as-is even if its
+    # name contains wildcard characters such as "[".
+    if batch or (_GLOB_MAGIC.search(input_source) and not os.path.exists(input_source)):
         _process_batch(
             input_source,
             output_dir,
             workers,
+            pool,
             config_obj,
             checkpoint_path,
             cache_path,
@@ -312,6 +339,8 @@ def generate(
         return
 
     # Interactive mode: prompt for missing configuration
+    from megaprompt.cli.interactive import interactive_config, prompt_missing_config
+
     if interactive:
         config_obj = interactive_config(config_obj, skip_confirmations=yes)
     else:
@@ -324,16 +353,13 @@ def generate(
             click.echo("Error: --idea-file is required when using --from-idea", err=True)
             sys.exit(1)
         
+        # click already checked that the idea file exists
         idea_path = Path(idea_file)
-        if not idea_path.exists():
-            click.echo(f"Error: Idea file not found: {idea_file}", err=True)
-            sys.exit(1)
-        
+
         try:
             from megaprompt.schemas.brainstorm import BrainstormResult
             
-            idea_data = json.loads(idea_path.read_text(encoding="utf-8"))
-            brainstorm_result = BrainstormResult.model_validate(idea_data)
+            brainstorm_result = BrainstormResult.model_validate_json(idea_path.read_bytes())
             
             if from_idea < 1 or from_idea > len(brainstorm_result.ideas):
                 click.echo(f"Error: Idea index {from_idea} out of range (1-{len(brainstorm_result.ideas)})", err=True)
@@ -360,17 +386,17 @@ def generate(
     else:
         # Read input normally
         if input_source == "-":
-            user_prompt = sys.stdin.read()
+            user_prompt = sys.stdin.buffer.read().decode("utf-8")
         else:
-            input_path = Path(input_source)
-            if not input_path.exists():
+            try:
+                user_prompt = _read_file_utf8(Path(input_source))
+            except FileNotFoundError:
                 click.echo(f"Error: Input file not found: {input_source}", err=True)
                 click.echo(f"  Current directory: {Path.cwd()}", err=True)
                 click.echo(f"  Tip: Use absolute path or check file exists", err=True)
                 sys.exit(1)
-            user_prompt = input_path.read_text(encoding="utf-8")
 
-    if not user_prompt.strip():
+    if not user_prompt or user_prompt.isspace():
         click.echo("Error: Input is empty", err=True)
         click.echo("  Tip: Check that the file contains text or stdin has data", err=True)
         sys.exit(1)
@@ -378,54 +404,36 @@ def generate(
     # Augment prompt with missing systems if provided
     if augment:
         try:
+            # click already checked that the augment file exists
             augment_path = Path(augment)
-            if not augment_path.exists():
-                click.echo(f"Warning: Augment file not found: {augment}", err=True)
-                click.echo("  Continuing without augmentation", err=True)
-            else:
-                augment_data = json.loads(augment_path.read_text(encoding="utf-8"))
-                missing_systems = augment_data.get("missing_systems", [])
-                partial_systems = augment_data.get("partial_systems", [])
-                
-                if missing_systems or partial_systems:
-                    augmentation_text = "\n\n## Missing Systems Analysis\n\n"
-                    augmentation_text += "The following systems were identified as missing or incomplete:\n\n"
-                    
-                    if missing_systems:
-                        augmentation_text += "### Missing Systems (Critical)\n\n"
-                        for system in missing_systems:
-                            augmentation_text += f"- **{system.get('system', 'Unknown')}** ({system.get('category', 'unknown')} category, {system.get('priority', 'medium')} priority)\n"
-                            augmentation_text += f"  - {system.get('rationale', 'No rationale provided')}\n"
-                    
-                    if partial_systems:
-                        augmentation_text += "\n### Partial Systems (Needs Completion)\n\n"
-                        for system in partial_systems:
-                            augmentation_text += f"- **{system.get('system', 'Unknown')}** ({system.get('category', 'unknown')} category, {system.get('priority', 'medium')} priority)\n"
-                            augmentation_text += f"  - {system.get('rationale', 'No rationale provided')}\n"
-                    
-                    user_prompt += augmentation_text
-                    if verbose:
-                        click.echo(f"Augmented prompt with {len(missing_systems)} missing and {len(partial_systems)} partial systems", err=True)
+            augment_data = serialization.loads(augment_path.read_bytes())
+            missing_systems = augment_data.get("missing_systems", [])
+            partial_systems = augment_data.get("partial_systems", [])
+
+            if missing_systems or partial_systems:
+                parts = [
+                    "\n\n## Missing Systems Analysis\n\n",
+                    "The following systems were identified as missing or incomplete:\n\n",
+                ]
+
+                if missing_systems:
+                    parts.append("### Missing Systems (Critical)\n\n")
+                    parts.extend(_format_augment_system(system) for system in missing_systems)
+
+                if partial_systems:
+                    parts.append("\n### Partial Systems (Needs Completion)\n\n")
+                    parts.extend(_format_augment_system(system) for system in partial_systems)
+
+                user_prompt += "".join(parts)
+                if verbose:
+                    click.echo(f"Augmented prompt with {len(missing_systems)} missing and {len(partial_systems)} partial systems", err=True)
         except Exception as e:
             click.echo(f"Warning: Failed to augment prompt: {e}", err=True)
             click.echo("  Continuing without augmentation", err=True)
 
-    # Setup checkpoint and cache directories
-    checkpoint_path = None
-    if resume or checkpoint_dir:
-        if checkpoint_dir:
-            checkpoint_path = Path(checkpoint_dir)
-        else:
-            checkpoint_path = config_obj.get_checkpoint_dir()
-
-    cache_path = None
-    if not no_cache:
-        if cache_dir:
-            cache_path = Path(cache_dir)
-        else:
-            cache_path = config_obj.get_cache_dir()
-
     # Initialize pipeline
+    from megaprompt.core.pipeline import MegaPromptPipeline
+
     try:
         pipeline = MegaPromptPipeline(
             provider=config_obj.provider,
@@ -451,7 +459,7 @@ def generate(
         sys.exit(1)
 
     # Initialize formatter
-    formatter = OutputFormatter(use_rich=True, force_color=color if color is not None else False)
+    formatter = _get_formatter(color)
 
     # Interactive mode: confirm before proceeding
     if interactive and not yes:
@@ -467,25 +475,28 @@ def generate(
         )
         elapsed_time = time.time() - start_time
 
-        # Calculate statistics
-        total_tokens = estimate_tokens(user_prompt + mega_prompt_text)
-        estimated_cost = estimate_cost(total_tokens, config_obj.provider, config_obj.model)
-
-        stats_data = {
-            "time_taken": f"{elapsed_time:.2f}s",
-            "input_tokens": estimate_tokens(user_prompt),
-            "output_tokens": estimate_tokens(mega_prompt_text),
-            "total_tokens": total_tokens,
-            "provider": config_obj.provider,
-            "model": config_obj.model or "default",
-        }
-        if estimated_cost is not None:
-            stats_data["estimated_cost"] = f"${estimated_cost:.4f}"
+        # Calculate statistics (only when they will be shown)
+        if stats:
+            from megaprompt.cli.formatters import estimate_cost, estimate_tokens
+
+            input_tokens = estimate_tokens(user_prompt)
+            output_tokens = estimate_tokens(mega_prompt_text)
+            total_tokens = input_tokens + output_tokens
+            estimated_cost = estimate_cost(total_tokens, config_obj.provider, config_obj.model)
+
+            stats_data = {
+                "time_taken": f"{elapsed_time:.2f}s",
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": total_tokens,
+                "provider": config_obj.provider,
+                "model": config_obj.model or "default",
+            }
+            if estimated_cost is not None:
+                stats_data["estimated_cost"] = f"${estimated_cost:.4f}"
 
         # Parse output formats (support multiple)
-        formats = [f.strip().lower() for f in output_format.split(",")]
-        if not formats:
-            formats = ["markdown"]
+        formats = _parse_formats(output_format)
 
         # Prepare output data
         output_data = {"mega_prompt": mega_prompt_text}
@@ -494,48 +505,59 @@ def generate(
 
         # Write outputs in requested formats
         output_paths = []
-        for idx, fmt in enumerate(formats):
+        if output:
+            targets: dict[Path, str] = {}
+            base_path = Path(output)
+            for fmt in formats:
+                suffix = _FMT_SUFFIX.get(fmt, ".md")
+                # If multiple formats, always append the format's extension; a
+                # single format keeps the original one when it already fits
+                # (or when the format is unknown)
+                if len(formats) > 1 or base_path.suffix not in _FMT_VALID_SUFFIXES.get(fmt, (base_path.suffix,)):
+                    output_path = base_path.with_suffix(suffix)
+                else:
+                    output_path = base_path
+                # Keyed by path so a repeated format is written once, never
+                # by two threads at the same time
+                targets[output_path] = fmt
+
+            intermediate = intermediate_outputs if config_obj.verbose else None
+            if len(targets) > 1:
+                # Each format only reads output_data, so serialize and write them
+                # concurrently, one thread per supported format at most
+                with ThreadPoolExecutor(max_workers=min(len(targets), len(_FMT_SUFFIX))) as executor:
+                    output_paths = list(
+                        executor.map(
+                            lambda target: _write_format(target[1], target[0], output_data, mega_prompt_text, intermediate),
+                            targets.items(),
+                        )
+                    )
+            else:
+                [(output_path, fmt)] = targets.items()
+                output_paths = [_write_format(fmt, output_path, output_data, mega_prompt_text, intermediate)]
+        else:
+            # Only print first format to stdout. Rich rendering is skipped when
+            # stdout is a pipe or file (unless --color forces it).
+            fmt = formats[0]
+            render = color or sys.stdout.isatty()
             if fmt == "json":
-                output_text = formatter.format_json(output_data)
+                if render:
+                    formatter.print_json(output_data)
+                else:
+                    click.echo(serialization.dumps(output_data))
             elif fmt == "yaml":
-                output_text = yaml.dump(output_data, default_flow_style=False, sort_keys=False)
+                click.echo(serialization.dump_yaml(output_data))
             else:  # markdown (default)
                 output_text = mega_prompt_text
                 if config_obj.verbose:
-                    output_text += "\n\n---\n\n# Intermediate Outputs\n\n"
-                    output_text += f"```json\n{json.dumps(intermediate_outputs, indent=2)}\n```"
-
-            # Determine output file
-            if output:
-                output_path = Path(output)
-                # If multiple formats, append extension
-                if len(formats) > 1:
-                    if fmt == "json":
-                        output_path = output_path.with_suffix(".json")
-                    elif fmt == "yaml":
-                        output_path = output_path.with_suffix(".yaml")
-                    else:
-                        output_path = output_path.with_suffix(".md")
+                    # Join once instead of growing the prompt text piece by piece
+                    output_text = "".join(
+                        (mega_prompt_text, _INTERMEDIATE_HEADER, serialization.dumps(intermediate_outputs), "\n```")
+                    )
+                if fmt == "markdown" and render:
+                    formatter.print_markdown(output_text)
                 else:
-                    # Single format - use original extension or add appropriate one
-                    if fmt == "json" and not output_path.suffix == ".json":
-                        output_path = output_path.with_suffix(".json")
-                    elif fmt == "yaml" and not output_path.suffix in [".yaml", ".yml"]:
-                        output_path = output_path.with_suffix(".yaml")
-                    elif fmt == "markdown" and not output_path.suffix == ".md":
-                        output_path = output_path.with_suffix(".md")
-                
-                output_path.write_text(output_text, encoding="utf-8")
-                output_paths.append(output_path)
-            else:
-                # Only print first format to stdout
-                if idx == 0:
-                    if fmt == "markdown":
-                        formatter.print_markdown(output_text)
-                    elif fmt == "json":
-                        formatter.print_json(output_data)
-                    else:
-                        click.echo(output_text)
+                    click.echo(output_text)
 
         # Show statistics
         if stats:
@@ -673,6 +695,18 @@ def generate(
     default=None,
     help="Base URL (provider-specific)",
 )
+@click.option(
+    "--cache-dir",
+    type=click.Path(),
+    default=None,
+    help="Directory for cache (default: ~/.megaprompt/cache)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Disable caching",
+)
 @click.option(
     "--verbose/--no-verbose",
     "-v/--no-v",
@@ -695,6 +729,8 @@ def brainstorm(
     temperature: float,
     api_key: str | None,
     base_url: str | None,
+    cache_dir: str | None,
+    no_cache: bool,
     verbose: bool,
 ):
     """
@@ -721,15 +757,15 @@ def brainstorm(
 
     # Read input
     if input_source == "-":
-        seed_prompt = sys.stdin.read()
+        seed_prompt = sys.stdin.buffer.read().decode("utf-8")
     else:
-        input_path = Path(input_source)
-        if not input_path.exists():
+        try:
+            seed_prompt = _read_file_utf8(Path(input_source))
+        except FileNotFoundError:
             click.echo(f"Error: Input file not found: {input_source}", err=True)
             sys.exit(1)
-        seed_prompt = input_path.read_text(encoding="utf-8")
 
-    if not seed_prompt.strip():
+    if not seed_prompt or seed_prompt.isspace():
         click.echo("Error: Input is empty", err=True)
         sys.exit(1)
 
@@ -738,6 +774,11 @@ def brainstorm(
     if constraints:
         constraints_list = [c.strip() for c in constraints.split(",") if c.strip()]
 
+    # Setup cache directory
+    cache_path = None
+    if not no_cache:
+        cache_path = Path(cache_dir) if cache_dir else Config.load().get_cache_dir()
+
     # Create pipeline
     try:
         pipeline = BrainstormPipeline(
@@ -746,6 +787,8 @@ def brainstorm(
             temperature=temperature,
             api_key=api_key,
             base_url=base_url,
+            cache_dir=cache_path,
+            use_cache=not no_cache,
         )
 
         # Run brainstorm
@@ -765,7 +808,7 @@ def brainstorm(
         # Write output
         if output:
             output_path = Path(output)
-            output_path.write_text(output_text, encoding="utf-8")
+            output_path.write_bytes(output_text.encode("utf-8"))
             if verbose:
                 click.echo(f"✓ Ideas written to: {output_path}")
         else:
@@ -810,7 +853,7 @@ def config_export(output: str | None, format: str):
         click.echo(f"Configuration exported to: {output_path}")
     else:
         if format == "yaml":
-            content = yaml.dump(config_obj.to_dict(), default_flow_style=False, sort_keys=False)
+            content = serialization.dump_yaml(config_obj.to_dict())
         else:
             content = json.dumps(config_obj.to_dict(), indent=2)
         click.echo(content)
@@ -833,8 +876,142 @@ def config_import(config_file: str):
 # _interactive_config is now imported from megaprompt.cli.interactive
 
 
+# Characters that make an input source a glob pattern (same set glob uses)
+_GLOB_MAGIC = re.compile(r"[*?\[]")
+
+
+@cache
+def _get_formatter(color: bool | None) -> "OutputFormatter":
+    """Return the shared Rich formatter for a --color setting."""
+    from megaprompt.cli.formatters import OutputFormatter
+
+    # None (no --color/--no-color) lets Rich auto-detect the terminal
+    return OutputFormatter(use_rich=True, force_color=color)
+
+
+# File suffix for each output format; unknown formats are written as markdown
+_FMT_SUFFIX = {"json": ".json", "yaml": ".yaml", "markdown": ".md"}
+
+# Existing extensions accepted as-is for single-format output
+_FMT_VALID_SUFFIXES = {"json": (".json",), "yaml": (".yaml", ".yml"), "markdown": (".md",)}
+
+
+def _parse_formats(output_format: str) -> tuple[str, ...]:
+    """Split a comma-separated --format value into normalized format names."""
+    if output_format == "markdown":
+        return ("markdown",)
+    return tuple(f.strip().lower() for f in output_format.split(","))
+
+
+# Per-worker state for batch processing. Each pool thread (or process) lazily
+# builds one pipeline on its first file and reuses it for the rest.
+_worker_state = threading.local()
+
+# Number of verbose batch progress lines buffered per console write
+_PROGRESS_FLUSH_EVERY = 16
+
+# Maximum seconds a buffered progress line waits before it is written
+_PROGRESS_FLUSH_INTERVAL = 1.0
+
+# Input files at least this large are decoded from a memory map
+_MMAP_MIN_SIZE = 64 * 1024
+
+# Report fields cleared by each analyze --mode ("full" keeps everything)
+_MODE_CLEAR = {
+    "holes": ("enhancements.enhancements", "intent_drift.drifts"),
+    "systems": ("enhancements.enhancements", "intent_drift.drifts"),
+    "enhancements": ("holes.missing", "holes.partial", "holes.present", "intent_drift.drifts"),
+}
+
+# Batch chunks kept submitted per worker; more are queued as these finish
+_IN_FLIGHT_PER_WORKER = 2
+
+# Separates the mega-prompt from the verbose intermediate outputs in markdown
+_INTERMEDIATE_HEADER = "\n\n---\n\n# Intermediate Outputs\n\n```json\n"
+_INTERMEDIATE_HEADER_BYTES = _INTERMEDIATE_HEADER.encode("utf-8")
+
+
+def _write_markdown(
+    output_path: Path,
+    mega_prompt_text: str,
+    intermediate_outputs: dict[str, Any] | None = None,
+) -> None:
+    """
+    Write markdown output through a large binary buffer.
+
+    Intermediate outputs are JSON-encoded directly into the file instead of
+    being concatenated onto the mega-prompt text first.
+    """
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        f.write(mega_prompt_text.encode("utf-8"))
+        if intermediate_outputs is not None:
+            f.write(_INTERMEDIATE_HEADER_BYTES)
+            serialization.dump(intermediate_outputs, f)
+            f.write(b"\n```")
+
+
+def _format_augment_system(system: dict[str, Any]) -> str:
+    """Format one --augment system entry as a markdown list item."""
+    return (
+        f"- **{system.get('system', 'Unknown')}** ({system.get('category', 'unknown')} category, "
+        f"{system.get('priority', 'medium')} priority)\n"
+        f"  - {system.get('rationale', 'No rationale provided')}\n"
+    )
+
+
+def _read_file_utf8(path: Path) -> str:
+    """
+    Read a UTF-8 text file.
+
+    Files of _MMAP_MIN_SIZE or more are memory-mapped and decoded straight
+    from the mapping, so the raw bytes are never copied into a Python
+    object alongside the decoded text. Smaller files (and pipes, which
+    report size 0) take a plain read, where mmap's setup cost dominates.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+            return f.read().decode("utf-8")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, "utf-8")
+
+
+def _write_format(
+    fmt: str,
+    output_path: Path,
+    output_data: dict[str, Any],
+    mega_prompt_text: str,
+    intermediate_outputs: dict[str, Any] | None,
+) -> Path:
+    """Serialize output_data in one format and write it to output_path."""
+    # JSON and YAML are streamed into the file rather than built as one string
+    if fmt == "json":
+        with open(output_path, "wb", buffering=1 << 20) as f:
+            serialization.dump(output_data, f)
+    elif fmt == "yaml":
+        with open(output_path, "wb", buffering=1 << 20) as f:
+            serialization.dump_yaml_to(output_data, f)
+    else:  # markdown (default)
+        _write_markdown(output_path, mega_prompt_text, intermediate_outputs)
+    return output_path
+
+
+def _available_cpus() -> int:
+    """Count the CPUs this process may run on (honours affinity masks and cpusets)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def _ensure_dirs(*dir_paths: Path | None) -> None:
+    """Create each given directory, ignoring None entries."""
+    for dir_path in dir_paths:
+        if dir_path is not None:
+            os.makedirs(dir_path, exist_ok=True)
+
+
 def _process_single_file(
     input_file: Path,
+    input_size: int,
     output_dir: Path | None,
     config_obj: Config,
     checkpoint_path: Path | None,
@@ -847,23 +1024,46 @@ def _process_single_file(
     verbose: bool,
 ) -> dict[str, Any]:
     """Process a single file in batch mode."""
-    try:
-        user_prompt = input_file.read_text(encoding="utf-8")
-        if not user_prompt.strip():
-            return {"file": str(input_file), "status": "skipped", "error": "Empty file"}
+    # Sizes come from the directory scan, so empty files are skipped unread
+    if input_size == 0:
+        return {"file": str(input_file), "name": input_file.name, "status": "skipped", "error": "Empty file"}
 
-        # Setup pipeline
-        pipeline = MegaPromptPipeline(
-            provider=config_obj.provider,
-            base_url=config_obj.base_url,
-            model=config_obj.model,
-            temperature=config_obj.temperature,
-            seed=config_obj.seed,
-            api_key=config_obj.api_key,
-            checkpoint_dir=checkpoint_path,
-            cache_dir=cache_path,
-            use_cache=not no_cache,
+    try:
+        user_prompt = _read_file_utf8(input_file)
+        if not user_prompt or user_prompt.isspace():
+            return {"file": str(input_file), "name": input_file.name, "status": "skipped", "error": "Empty file"}
+
+        # Reuse this worker's pipeline (LLM client, cache, checkpoints) across
+        # files, rebuilding it only if the settings it was built with change
+        pipeline_key = (
+            config_obj.provider,
+            config_obj.model,
+            config_obj.base_url,
+            config_obj.temperature,
+            config_obj.seed,
+            config_obj.api_key,
+            checkpoint_path,
+            cache_path,
+            not no_cache,
         )
+        pipeline = getattr(_worker_state, "pipeline", None)
+        if pipeline is None or _worker_state.pipeline_key != pipeline_key:
+            from megaprompt.core.pipeline import MegaPromptPipeline
+
+            pipeline = MegaPromptPipeline(
+                provider=config_obj.provider,
+                base_url=config_obj.base_url,
+                model=config_obj.model,
+                temperature=config_obj.temperature,
+                seed=config_obj.seed,
+                api_key=config_obj.api_key,
+                checkpoint_dir=checkpoint_path,
+                cache_dir=cache_path,
+                use_cache=not no_cache,
+                create_dirs=False,  # created once by _process_batch
+            )
+            _worker_state.pipeline = pipeline
+            _worker_state.pipeline_key = pipeline_key
 
         # Generate
         start_time = time.time()
@@ -872,41 +1072,147 @@ def _process_single_file(
         )
         elapsed_time = time.time() - start_time
 
-        # Determine output path
-        if output_dir:
-            output_path = output_dir / f"{input_file.stem}_output.md"
-        else:
-            output_path = input_file.parent / f"{input_file.stem}_output.md"
-
-        # Write output
-        formats = [f.strip().lower() for f in output_format.split(",")]
-        for fmt in formats:
+        # Output files share one base name; only the suffix varies per format
+        output_base = f"{input_file.stem}_output"
+        output_parent = output_dir or input_file.parent
+
+        # Serialize each requested format once, then write them all
+        output_data = {"mega_prompt": mega_prompt_text, "intermediate": intermediate_outputs}
+        outputs: dict[str, tuple[Path, bytes]] = {}
+        for fmt in _parse_formats(output_format):
+            if fmt not in _FMT_SUFFIX:
+                fmt = "markdown"
+            if fmt in outputs:
+                continue
             if fmt == "json":
-                output_data = {"mega_prompt": mega_prompt_text, "intermediate": intermediate_outputs}
-                output_path = output_path.with_suffix(".json")
-                output_path.write_text(json.dumps(output_data, indent=2), encoding="utf-8")
+                content = serialization.dumps_bytes(output_data)
             elif fmt == "yaml":
-                output_data = {"mega_prompt": mega_prompt_text, "intermediate": intermediate_outputs}
-                output_path = output_path.with_suffix(".yaml")
-                output_path.write_text(yaml.dump(output_data, default_flow_style=False), encoding="utf-8")
+                content = serialization.dump_yaml(output_data, sort_keys=True).encode("utf-8")
             else:
-                output_path = output_path.with_suffix(".md")
-                output_path.write_text(mega_prompt_text, encoding="utf-8")
+                content = mega_prompt_text.encode("utf-8")
+            outputs[fmt] = (output_parent / (output_base + _FMT_SUFFIX[fmt]), content)
+
+        for path, content in outputs.values():
+            path.write_bytes(content)
 
         return {
             "file": str(input_file),
+            "name": input_file.name,
             "status": "success",
-            "output": str(output_path),
+            "outputs": [str(path) for path, _ in outputs.values()],
             "time": f"{elapsed_time:.2f}s",
         }
     except Exception as e:
-        return {"file": str(input_file), "status": "error", "error": str(e)}
+        return {"file": str(input_file), "name": input_file.name, "status": "error", "error": str(e)}
+
+
+@lru_cache(maxsize=256)
+def _compile_glob(component: str) -> re.Pattern[str]:
+    """Compile one glob path component, case-insensitively where the OS is."""
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile(fnmatch.translate(component), flags)
+
+
+def _process_chunk(files: list[tuple[Path, int]], *file_args: Any) -> list[dict[str, Any]]:
+    """Process a chunk of (path, size) batch entries in one worker task."""
+    return [_process_single_file(path, size, *file_args) for path, size in files]
+
+
+def _expand_pattern(pattern: str) -> list[tuple[Path, int]]:
+    """
+    Expand a glob pattern (or directory) to the regular files it matches.
+
+    The pattern is split into a literal prefix and a wildcard tail. Walking
+    starts at the deepest literal directory and descends with os.scandir
+    only into subdirectories matching the next component, so DirEntry's
+    cached file types replace per-match stat calls. A "**" component
+    matches zero or more directories. A directory expands to the files
+    directly inside it. Like glob, hidden names only match components that
+    start with ".", and a pattern ending in a separator matches no files.
+
+    Returns:
+        (path, size in bytes) pairs sorted by path
+    """
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, "*")
+    if os.sep != "/":
+        pattern = pattern.replace(os.sep, "/")
+    if pattern.endswith("/"):
+        # As in glob, a trailing separator only matches directories
+        return []
+
+    components = pattern.split("/")
+    for first_magic, component in enumerate(components):
+        if _GLOB_MAGIC.search(component):
+            break
+    else:
+        # No wildcards at all: a plain file path
+        try:
+            st = os.stat(pattern)
+        except OSError:
+            return []
+        return [(Path(pattern), st.st_size)] if stat.S_ISREG(st.st_mode) else []
+
+    base = "/".join(components[:first_magic]) or ("/" if pattern.startswith("/") else "")
+    tail = [c for c in components[first_magic:] if c]
+    if tail[-1] == "**":
+        tail.append("*")  # trailing "**" means every file below
+    matchers = [None if c == "**" else _compile_glob(c).match for c in tail]
+
+    matches: dict[str, int] = {}
+    stack = [(base, 0)]
+    while stack:
+        directory, idx = stack.pop()
+        component = tail[idx]
+        match = matchers[idx]
+        if match is None:
+            # "**": continue with the next component here (zero directories) ...
+            stack.append((directory, idx + 1))
+        last = idx == len(tail) - 1
+        include_hidden = component.startswith(".")
+        try:
+            with os.scandir(directory or os.curdir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith(".") and not include_hidden:
+                        continue
+                    path = os.path.join(directory, name) if directory else name
+                    if match is None:
+                        # ... and descend one more level under the same "**"
+                        if entry.is_dir():
+                            stack.append((path, idx))
+                    elif match(name):
+                        if last:
+                            if entry.is_file():
+                                matches[path] = entry.stat().st_size
+                        elif entry.is_dir():
+                            stack.append((path, idx + 1))
+        except OSError:
+            continue
+    return sorted((Path(path), size) for path, size in matches.items())
+
+
+def _live_progress_enabled(formatter: "OutputFormatter", verbose: bool) -> bool:
+    """
+    Whether verbose batch progress can be drawn as a live bar.
+
+    Both the console (which --color/--no-color may force either way) and the
+    real stdout must be terminals: a forced console writing to a pipe or
+    file would fill it with redraws.
+    """
+    return (
+        verbose
+        and formatter.console is not None
+        and formatter.console.is_terminal
+        and sys.stdout.isatty()
+    )
 
 
 def _process_batch(
     input_pattern: str,
     output_dir: str | None,
     workers: int | None,
+    pool: str,
     config_obj: Config,
     checkpoint_path: Path | None,
     cache_path: Path | None,
@@ -918,7 +1224,7 @@ def _process_batch(
     verbose: bool,
 ) -> None:
     """Process multiple files in batch mode."""
-    formatter = OutputFormatter(use_rich=True, force_color=color if color is not None else False)
+    formatter = _get_formatter(color)
 
     # Find input files
     if input_pattern == "-":
@@ -926,67 +1232,115 @@ def _process_batch(
         sys.exit(1)
 
     # Expand glob pattern
-    input_files = [Path(f) for f in glob.glob(input_pattern) if Path(f).is_file()]
+    input_files = _expand_pattern(input_pattern)
     if not input_files:
         click.echo(f"Error: No files found matching pattern: {input_pattern}", err=True)
         sys.exit(1)
 
     formatter.print_info(f"Found {len(input_files)} file(s) to process")
 
-    # Setup output directory
+    # Create output, checkpoint and cache directories once, before any worker starts
     output_path = Path(output_dir) if output_dir else None
-    if output_path:
-        output_path.mkdir(parents=True, exist_ok=True)
-
-    # Determine number of workers
-    num_workers = workers or os.cpu_count() or 1
-
-    # Process files in parallel
-    results = []
-    with ThreadPoolExecutor(max_workers=num_workers) as executor:
-        futures = {
-            executor.submit(
-                _process_single_file,
-                input_file,
-                output_path,
-                config_obj,
-                checkpoint_path,
-                cache_path,
-                no_cache,
-                resume,
-                output_format,
-                stats,
-                color,
-                verbose,
-            ): input_file
-            for input_file in input_files
-        }
-
-        completed = 0
-        for future in as_completed(futures):
-            completed += 1
-            result = future.result()
-            results.append(result)
-            if verbose:
-                status_icon = "✓" if result["status"] == "success" else "✗"
-                formatter.print_info(f"[{completed}/{len(input_files)}] {status_icon} {Path(result['file']).name}")
+    _ensure_dirs(output_path, checkpoint_path, None if no_cache else cache_path)
+
+    # Determine number of workers. Threads mostly wait on the LLM, so an
+    # explicit --workers may exceed the core count; processes may not.
+    available_cpus = _available_cpus()
+    num_workers = workers or available_cpus
+    if pool == "process":
+        num_workers = min(num_workers, available_cpus)
+    # No point starting more workers than there are files
+    num_workers = max(1, min(num_workers, len(input_files)))
+
+    # Process files in parallel. Arguments and results are plain picklable
+    # values, so the same worker function runs under threads or processes.
+    executor_cls = ProcessPoolExecutor if pool == "process" else ThreadPoolExecutor
+    # Process pools ship files in chunks to amortize IPC; threads take one at a time
+    total = len(input_files)
+    chunksize = max(1, total // (num_workers * 4)) if pool == "process" else 1
+    chunks = (input_files[i : i + chunksize] for i in range(0, total, chunksize))
+    file_args = (
+        output_path,
+        config_obj,
+        checkpoint_path,
+        cache_path,
+        no_cache,
+        resume,
+        output_format,
+        stats,
+        color,
+        verbose,
+    )
+    successful = skipped = 0
+    failed = []
+    progress_lines = []
+    completed = 0
+    last_flush = time.monotonic()
+    # On a terminal, verbose progress is a live bar that Rich redraws at its own
+    # refresh rate; otherwise per-file lines are buffered and written in blocks
+    progress_task = None
+    if _live_progress_enabled(formatter, verbose):
+        progress_task = formatter.create_progress_bar("Processing", total=total)
+    try:
+        with executor_cls(max_workers=num_workers) as executor:
+            # Keep a bounded window of chunks in flight and submit the next one as
+            # each finishes, so pending futures stay O(workers) rather than O(files)
+            in_flight = {
+                executor.submit(_process_chunk, chunk, *file_args)
+                for chunk in islice(chunks, _IN_FLIGHT_PER_WORKER * num_workers)
+            }
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    next_chunk = next(chunks, None)
+                    if next_chunk is not None:
+                        in_flight.add(executor.submit(_process_chunk, next_chunk, *file_args))
+
+                    for result in future.result():
+                        completed += 1
+                        status = result["status"]
+                        if status == "success":
+                            successful += 1
+                        elif status == "skipped":
+                            skipped += 1
+                        else:
+                            failed.append(result)
+
+                        if progress_task is not None:
+                            formatter.update_progress(progress_task, completed)
+                            if status == "error":
+                                formatter.print_error(f"[{completed}/{total}] ✗ {result['name']}")
+                        elif verbose:
+                            status_icon = "✓" if status == "success" else "✗"
+                            progress_lines.append(f"[{completed}/{total}] {status_icon} {result['name']}")
+                            # Flush progress in blocks to keep console writes off the per-file
+                            # path, but never hold lines back for long on slow batches
+                            now = time.monotonic()
+                            if (
+                                len(progress_lines) >= _PROGRESS_FLUSH_EVERY
+                                or now - last_flush >= _PROGRESS_FLUSH_INTERVAL
+                                or completed == total
+                            ):
+                                formatter.print_info_lines(progress_lines)
+                                progress_lines.clear()
+                                last_flush = now
+    finally:
+        if progress_task is not None:
+            formatter.stop_progress()
+            formatter.remove_progress(progress_task)
 
     # Generate summary report
-    successful = [r for r in results if r["status"] == "success"]
-    failed = [r for r in results if r["status"] == "error"]
-    skipped = [r for r in results if r["status"] == "skipped"]
-
     formatter.print_success(f"\nBatch processing complete:")
-    formatter.print_info(f"  Successful: {len(successful)}")
+    formatter.print_info(f"  Successful: {successful}")
     if failed:
         formatter.print_error(f"  Failed: {len(failed)}")
     if skipped:
-        formatter.print_warning(f"  Skipped: {len(skipped)}")
+        formatter.print_warning(f"  Skipped: {skipped}")
 
     if failed and verbose:
         formatter.print_error("\nFailed files:")
         for result in failed:
-            formatter.print_error(f"  - {Path(result['file']).name}: {result.get('error', 'Unknown error')}")
+            formatter.print_error(f"  - {result['name']}: {result.get('error', 'Unknown error')}")
 
 
 @main.command()
@@ -1156,41 +1510,54 @@ def analyze(
     codebase_path_obj = Path(codebase_path).expanduser().resolve()
     
     if not codebase_path_obj.exists():
-        click.echo(f"Error: Codebase path does not exist: {codebase_path_obj}", err=True)
-        click.echo(f"  Provided path: {codebase_path}", err=True)
-        click.echo(f"  Current directory: {Path.cwd()}", err=True)
-        
+        # Collect the whole message so stderr gets a single write
+        lines = [
+            f"Error: Codebase path does not exist: {codebase_path_obj}",
+            f"  Provided path: {codebase_path}",
+            f"  Current directory: {Path.cwd()}",
+        ]
+
         # Smart suggestion: if path starts with ./ and looks like it should be absolute
         if codebase_path.startswith("./") and codebase_path.count("/") >= 2:
             # Remove ./ and try as absolute path
             suggested_abs = "/" + codebase_path[2:]
             suggested_path_obj = Path(suggested_abs).expanduser().resolve()
             if suggested_path_obj.exists():
-                click.echo(f"  Tip: Did you mean: {suggested_path_obj} (remove './' and use absolute path)?", err=True)
+                lines.append(f"  Tip: Did you mean: {suggested_path_obj} (remove './' and use absolute path)?")
             else:
-                click.echo(f"  Tip: If this should be an absolute path, try: {suggested_abs}", err=True)
-                click.echo(f"  Tip: Or use a relative path from current directory, or check the path is correct", err=True)
+                lines.append(f"  Tip: If this should be an absolute path, try: {suggested_abs}")
+                lines.append("  Tip: Or use a relative path from current directory, or check the path is correct")
         elif not Path(codebase_path).is_absolute():
-            click.echo(f"  Tip: Use absolute path (e.g., /home/user/path) or check the path is correct", err=True)
+            lines.append("  Tip: Use absolute path (e.g., /home/user/path) or check the path is correct")
         else:
-            click.echo(f"  Tip: Check the path is correct", err=True)
+            lines.append("  Tip: Check the path is correct")
+        click.echo("\n".join(lines), err=True)
         sys.exit(1)
     
     if not codebase_path_obj.is_dir():
-        click.echo(f"Error: Codebase path is not a directory: {codebase_path_obj}", err=True)
-        click.echo(f"  Tip: Provide a directory path, not a file", err=True)
+        click.echo(
+            f"Error: Codebase path is not a directory: {codebase_path_obj}\n"
+            "  Tip: Provide a directory path, not a file",
+            err=True,
+        )
         sys.exit(1)
     
     # Validate compare_with path if provided
     if compare_with:
         compare_with_obj = Path(compare_with).expanduser().resolve()
         if not compare_with_obj.exists():
-            click.echo(f"Error: Original prompt file does not exist: {compare_with_obj}", err=True)
-            click.echo(f"  Tip: Check the file path is correct", err=True)
+            click.echo(
+                f"Error: Original prompt file does not exist: {compare_with_obj}\n"
+                "  Tip: Check the file path is correct",
+                err=True,
+            )
             sys.exit(1)
         if not compare_with_obj.is_file():
-            click.echo(f"Error: Original prompt path is not a file: {compare_with_obj}", err=True)
-            click.echo(f"  Tip: Provide a file path for --compare-with", err=True)
+            click.echo(
+                f"Error: Original prompt path is not a file: {compare_with_obj}\n"
+                "  Tip: Provide a file path for --compare-with",
+                err=True,
+            )
             sys.exit(1)
         compare_with = str(compare_with_obj)
 
@@ -1208,25 +1575,12 @@ def analyze(
             original_prompt_path=compare_with,
         )
 
-        # Filter by mode if needed
-        if mode != "full":
-            if mode == "holes":
-                # Only show holes
-                report.enhancements.enhancements = []
-                if report.intent_drift:
-                    report.intent_drift.drifts = []
-            elif mode == "systems":
-                # Only show systems analysis
-                report.enhancements.enhancements = []
-                if report.intent_drift:
-                    report.intent_drift.drifts = []
-            elif mode == "enhancements":
-                # Only show enhancements
-                report.holes.missing = []
-                report.holes.partial = []
-                report.holes.present = []
-                if report.intent_drift:
-                    report.intent_drift.drifts = []
+        # Filter by mode: clear the report sections the mode does not show
+        for field_path in _MODE_CLEAR.get(mode, ()):
+            parent_path, _, field = field_path.rpartition(".")
+            parent = attrgetter(parent_path)(report)
+            if parent is not None:  # intent_drift is only set with --compare-with
+                setattr(parent, field, [])
 
         # Generate report
         generator = ReportGenerator()
@@ -1239,19 +1593,20 @@ def analyze(
         # Export missing systems if requested
         if export:
             try:
-                import json
+                from megaprompt.schemas.analysis import MissingSystemsExport
+
                 export_path = Path(export).expanduser().resolve()
                 export_path.parent.mkdir(parents=True, exist_ok=True)
-                export_data = {
-                    "missing_systems": [h.model_dump() for h in report.holes.missing],
-                    "partial_systems": [h.model_dump() for h in report.holes.partial],
-                }
-                export_path.write_text(json.dumps(export_data, indent=2), encoding="utf-8")
+                # Serialized in one pass by pydantic-core, without building dicts first
+                export_data = MissingSystemsExport(
+                    missing_systems=report.holes.missing,
+                    partial_systems=report.holes.partial,
+                )
+                export_path.write_bytes(export_data.model_dump_json(indent=2).encode("utf-8"))
                 if verbose:
                     click.echo(f"Exported missing systems to: {export_path}", err=True)
             except PermissionError as e:
-                click.echo(f"Error: Cannot write to export file: {export}", err=True)
-                click.echo(f"  {e}", err=True)
+                click.echo(f"Error: Cannot write to export file: {export}\n  {e}", err=True)
                 sys.exit(1)
             except Exception as e:
                 click.echo(f"Error exporting missing systems: {e}", err=True)
@@ -1262,12 +1617,11 @@ def analyze(
             try:
                 output_path = Path(output).expanduser().resolve()
                 output_path.parent.mkdir(parents=True, exist_ok=True)
-                output_path.write_text(report_text, encoding="utf-8")
+                output_path.write_bytes(report_text.encode("utf-8"))
                 if verbose:
                     click.echo(f"Analysis report written to: {output_path}")
             except PermissionError as e:
-                click.echo(f"Error: Cannot write to output file: {output}", err=True)
-                click.echo(f"  {e}", err=True)
+                click.echo(f"Error: Cannot write to output file: {output}\n  {e}", err=True)
                 sys.exit(1)
             except Exception as e:
                 click.echo(f"Error writing output file: {e}", err=True)
@@ -1277,37 +1631,34 @@ def analyze(
 
     except ValueError as e:
         # Handle validation errors (e.g., path issues)
-        click.echo(f"Error: {e}", err=True)
+        message = f"Error: {e}"
         if "does not exist" in str(e) or "path" in str(e).lower():
-            try:
-                resolved = Path(codebase_path).expanduser().resolve()
-                click.echo(f"  Provided path: {codebase_path}", err=True)
-                click.echo(f"  Resolved path: {resolved}", err=True)
-            except Exception:
-                click.echo(f"  Provided path: {codebase_path}", err=True)
+            message += f"\n  Provided path: {codebase_path}\n  Resolved path: {codebase_path_obj}"
+        click.echo(message, err=True)
         sys.exit(1)
     except FileNotFoundError as e:
-        click.echo(f"Error: File or directory not found: {e}", err=True)
-        click.echo(f"  Provided path: {codebase_path}", err=True)
+        click.echo(f"Error: File or directory not found: {e}\n  Provided path: {codebase_path}", err=True)
         sys.exit(1)
     except PermissionError as e:
-        click.echo(f"Error: Permission denied accessing path: {e}", err=True)
-        try:
-            resolved = Path(codebase_path).expanduser().resolve()
-            click.echo(f"  Path: {resolved}", err=True)
-        except Exception:
-            click.echo(f"  Path: {codebase_path}", err=True)
-        click.echo(f"  Tip: Check file permissions or run with appropriate access", err=True)
+        click.echo(
+            "\n".join(
+                [
+                    f"Error: Permission denied accessing path: {e}",
+                    f"  Path: {codebase_path_obj}",
+                    "  Tip: Check file permissions or run with appropriate access",
+                ]
+            ),
+            err=True,
+        )
         sys.exit(1)
     except Exception as e:
         # Generic error handling
-        click.echo(f"Error during analysis: {e}", err=True)
         if verbose:
             import traceback
-            click.echo("\nFull traceback:", err=True)
+            click.echo(f"Error during analysis: {e}\n\nFull traceback:", err=True)
             traceback.print_exc()
         else:
-            click.echo(f"  Tip: Run with --verbose to see full error details", err=True)
+            click.echo(f"Error during analysis: {e}\n  Tip: Run with --verbose to see full error details", err=True)
         sys.exit(1)
 
 
@@ -1,11 +1,13 @@
 """Brainstorm pipeline orchestrator."""
 
+import os
 import random
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Literal, Optional, TypeVar
 
+from megaprompt.core.cache import Cache
 from megaprompt.core.llm_base import LLMClientBase
 from megaprompt.core.logging import get_logger, StructuredLogger
 from megaprompt.core.progress import ProgressIndicator
@@ -23,6 +25,20 @@ from megaprompt.stages.brainstorm.idea_synthesizer import IdeaSynthesizer
 from megaprompt.stages.brainstorm.quality_enforcer import QualityEnforcer
 from megaprompt.stages.brainstorm.self_critique_injector import SelfCritiqueInjector
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _default_max_parallel() -> int:
+    """Concurrent request limit from MEGAPROMPT_MAX_PARALLEL, else the default."""
+    # Stage calls wait on the network, not the CPU, so allow well over
+    # one request per core
+    default = max(32, (os.cpu_count() or 1) * 5)
+    try:
+        return int(os.getenv("MEGAPROMPT_MAX_PARALLEL", default))
+    except ValueError:
+        return default
+
 
 class BrainstormPipeline:
     """Orchestrates the brainstorm pipeline to generate multiple project ideas."""
@@ -35,6 +51,9 @@ class BrainstormPipeline:
         temperature: float = 0.7,  # Higher temperature for creativity
         seed: Optional[int] = None,
         api_key: Optional[str] = None,
+        max_parallel_requests: Optional[int] = None,
+        cache_dir: Optional[Path] = None,
+        use_cache: bool = True,
     ):
         """
         Initialize brainstorm pipeline.
@@ -46,9 +65,18 @@ class BrainstormPipeline:
             temperature: Generation temperature (higher for more creativity)
             seed: Random seed for determinism
             api_key: API key (for Qwen, Gemini, or OpenRouter)
+            max_parallel_requests: Maximum concurrent LLM requests per stage
+                (defaults to MEGAPROMPT_MAX_PARALLEL, else max(32, 5 x CPUs);
+                clamped to at least 1)
+            cache_dir: Directory for cache (None to disable)
+            use_cache: Whether to use caching (only applies when seed is set
+                or temperature is 0)
         """
         self.provider = provider
         self.model = model
+        self.temperature = temperature
+        self.seed = seed
+        self.max_parallel_requests = max(1, max_parallel_requests or _default_max_parallel())
 
         # Create base client
         base_client = create_client(
@@ -79,6 +107,12 @@ class BrainstormPipeline:
         self.deduplicator = Deduplicator(similarity_threshold=0.7)
         self.self_critique_injector = SelfCritiqueInjector(self.llm_client)
 
+        # Initialize cache. Sampled output is meant to differ between runs, so
+        # responses are only cached when generation is deterministic
+        self.cache: Optional[Cache] = None
+        if use_cache and cache_dir and (seed is not None or temperature == 0):
+            self.cache = Cache(cache_dir)
+
         # Initialize progress indicator
         self.progress = ProgressIndicator(enabled=True)
 
@@ -123,15 +157,23 @@ class BrainstormPipeline:
             # Stage 1: Idea Space Expansion
             if verbose:
                 self.progress.update("Expanding idea space...", progress=0.1)
-            idea_space: IdeaSpaceExpansion = self.idea_space_expander.expand(
-                seed_prompt, domain=domain
+            idea_space: IdeaSpaceExpansion = self._cached(
+                "brainstorm_expansion",
+                {"seed_prompt": seed_prompt, "domain": domain},
+                lambda: self.idea_space_expander.expand(seed_prompt, domain=domain),
+                IdeaSpaceExpansion.model_validate,
+                IdeaSpaceExpansion.model_dump,
             )
 
             # Stage 2: Concept Clustering
             if verbose:
                 self.progress.update("Clustering concepts...", progress=0.2)
-            clusters: ConceptClusters = self.concept_clusterer.cluster(
-                idea_space, target_count=count, domain=domain
+            clusters: ConceptClusters = self._cached(
+                "brainstorm_clustering",
+                {"idea_space": idea_space.model_dump(), "target_count": count, "domain": domain},
+                lambda: self.concept_clusterer.cluster(idea_space, target_count=count, domain=domain),
+                ConceptClusters.model_validate,
+                ConceptClusters.model_dump,
             )
 
             # Stage 3: Idea Synthesis (generate ideas per cluster)
@@ -147,23 +189,31 @@ class BrainstormPipeline:
 
             all_ideas: list[ProjectIdea] = []
 
-            # Generate ideas in parallel per cluster
-            with ThreadPoolExecutor(max_workers=min(4, len(clusters.clusters))) as executor:
-                futures = {}
-                total_submitted = 0
-                for idx, cluster in enumerate(clusters.clusters):
-                    # Distribute extra ideas to first clusters
-                    cluster_idea_count = ideas_per_cluster + (1 if idx < extra_ideas else 0)
-                    for _ in range(cluster_idea_count):
-                        future = executor.submit(
-                            self._generate_single_idea,
-                            cluster,
-                            constraints,
-                            domain,
-                            depth,
-                        )
-                        futures[future] = cluster.name
-                        total_submitted += 1
+            # One synthesis job per idea; extra ideas go to the first clusters.
+            # The ordinal tells apart (and caches separately) repeat ideas from
+            # the same cluster.
+            jobs = [
+                (cluster, ordinal)
+                for idx, cluster in enumerate(clusters.clusters)
+                for ordinal in range(ideas_per_cluster + (1 if idx < extra_ideas else 0))
+            ]
+            total_submitted = len(jobs)
+
+            # Generate ideas in parallel, with every job in flight up to the cap
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(total_submitted, self.max_parallel_requests))
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        self._generate_single_idea,
+                        cluster,
+                        constraints,
+                        domain,
+                        depth,
+                        ordinal,
+                    ): cluster.name
+                    for cluster, ordinal in jobs
+                }
 
                 completed = 0
                 for future in as_completed(futures):
@@ -183,8 +233,8 @@ class BrainstormPipeline:
             if verbose:
                 self.progress.update("Enforcing quality gates...", progress=0.7)
             quality_checked_ideas: list[ProjectIdea] = []
-            for idea in all_ideas:
-                status, checked_idea, reason = self.quality_enforcer.enforce(idea)
+            # Each idea is checked independently, so the LLM calls overlap
+            for status, checked_idea, reason in self._map_concurrently(self._enforce, all_ideas):
                 if status == "accepted":
                     quality_checked_ideas.append(checked_idea)
                 elif status == "improved" and checked_idea:
@@ -211,10 +261,13 @@ class BrainstormPipeline:
                     idea = self._generate_single_idea(
                         cluster, constraints, domain, depth
                     )
-                    status, checked_idea, _ = self.quality_enforcer.enforce(idea)
-                    if status in ("accepted", "improved") and checked_idea:
+                    status, checked_idea, _ = self._enforce(idea)
+                    if (
+                        status in ("accepted", "improved")
+                        and checked_idea
+                        and not self.deduplicator.is_duplicate(checked_idea, unique_ideas)
+                    ):
                         unique_ideas.append(checked_idea)
-                        unique_ideas = self.deduplicator.deduplicate(unique_ideas)
                         if verbose:
                             self.progress.update(
                                 f"Generated additional idea: {len(unique_ideas)}/{count}",
@@ -233,14 +286,9 @@ class BrainstormPipeline:
             if verbose:
                 self.progress.update("Adding self-critique...", progress=0.9)
 
-            final_ideas: list[ProjectIdea] = []
-            for idea in unique_ideas:
-                try:
-                    critiqued_idea = self.self_critique_injector.inject(idea)
-                    final_ideas.append(critiqued_idea)
-                except Exception:
-                    # If critique fails, use original idea
-                    final_ideas.append(idea)
+            final_ideas: list[ProjectIdea] = self._map_concurrently(
+                self._critique_or_original, unique_ideas
+            )
 
             elapsed_time = time.time() - start_time
 
@@ -277,9 +325,117 @@ class BrainstormPipeline:
         constraints: Optional[list[str]],
         domain: Optional[str],
         depth: str,
+        ordinal: Optional[int] = None,
     ) -> ProjectIdea:
-        """Generate a single idea from a cluster (helper method)."""
-        return self.idea_synthesizer.synthesize(
-            cluster, constraints=constraints, domain=domain, depth=depth
+        """
+        Generate a single idea from a cluster (helper method).
+
+        Planned ideas pass their ordinal within the cluster and are cached
+        under it; top-up ideas pass None and always call the LLM, since they
+        exist to produce something new.
+        """
+
+        def synthesize() -> ProjectIdea:
+            return self.idea_synthesizer.synthesize(
+                cluster, constraints=constraints, domain=domain, depth=depth
+            )
+
+        if ordinal is None:
+            return synthesize()
+        return self._cached(
+            "brainstorm_synthesis",
+            {
+                "cluster": cluster.model_dump(),
+                "constraints": constraints,
+                "domain": domain,
+                "depth": depth,
+                "ordinal": ordinal,
+            },
+            synthesize,
+            ProjectIdea.model_validate,
+            ProjectIdea.model_dump,
+        )
+
+    def _enforce(
+        self, idea: ProjectIdea
+    ) -> tuple[Literal["accepted", "rejected", "improved"], ProjectIdea | None, str | None]:
+        """Run the quality gates on an idea, caching the (status, idea, reason) verdict."""
+        return self._cached(
+            "brainstorm_quality",
+            idea.model_dump(),
+            lambda: self.quality_enforcer.enforce(idea),
+            lambda cached: (
+                cached[0],
+                ProjectIdea.model_validate(cached[1]) if cached[1] is not None else None,
+                cached[2],
+            ),
+            lambda verdict: [
+                verdict[0],
+                verdict[1].model_dump() if verdict[1] is not None else None,
+                verdict[2],
+            ],
         )
 
+    def _critique_or_original(self, idea: ProjectIdea) -> ProjectIdea:
+        """Add self-critique to an idea, falling back to the idea itself on failure."""
+        try:
+            return self._cached(
+                "brainstorm_critique",
+                idea.model_dump(),
+                lambda: self.self_critique_injector.inject(idea),
+                ProjectIdea.model_validate,
+                ProjectIdea.model_dump,
+            )
+        except Exception:
+            # If critique fails, use original idea
+            return idea
+
+    def _map_concurrently(self, fn: Callable[[T], R], items: list[T]) -> list[R]:
+        """
+        Apply fn to each item on a thread pool, keeping input order.
+
+        Stage calls are network-bound LLM requests, so threads overlap them
+        the same way idea synthesis does. Exceptions from fn propagate.
+        """
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(len(items), self.max_parallel_requests)) as executor:
+            return list(executor.map(fn, items))
+
+    def _cached(
+        self,
+        stage: str,
+        input_data: Any,
+        compute: Callable[[], T],
+        load: Callable[[Any], T],
+        dump: Callable[[T], Any],
+    ) -> T:
+        """
+        Return a stage result from the cache, computing and storing it on a miss.
+
+        Args:
+            stage: Stage name used in the cache key
+            input_data: JSON-serializable stage input used in the cache key
+                (with the pipeline's provider, model, temperature and seed)
+            compute: Produces the result on a cache miss
+            load: Rebuilds the result from its cached JSON value
+            dump: Converts the result to a JSON-serializable value
+
+        Returns:
+            Cached or freshly computed result
+        """
+        if self.cache is None:
+            return compute()
+        # Sampling settings change what the LLM returns, so they are part of the key
+        cache_key = self.cache.get_cache_key(
+            stage,
+            {"input": input_data, "temperature": self.temperature, "seed": self.seed},
+            self.provider,
+            self.model,
+        )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return load(cached)
+        result = compute()
+        self.cache.set(cache_key, dump(result))
+        return result
@@ -2,27 +2,47 @@
 
 import hashlib
 import json
+import sqlite3
+import threading
+import time
 from pathlib import Path
 from typing import Any, Optional
 
+from megaprompt.core import serialization
+
 
 class Cache:
-    """Cache manager for pipeline results."""
+    """Cache manager for pipeline results, stored in a SQLite database."""
 
-    def __init__(self, cache_dir: Path):
-        """Initialize cache with directory."""
+    def __init__(self, cache_dir: Path, create_dir: bool = True):
+        """Initialize cache with directory (created unless create_dir is False)."""
         self.cache_dir = cache_dir
-        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = cache_dir / "cache.db"
+        if create_dir:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        # sqlite3 connections cannot be shared between threads, so each
+        # thread opens its own on first use
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's database connection, opening it if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit; WAL lets batch workers read while another writes
+            conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, metadata BLOB, ts REAL NOT NULL)"
+            )
+            self._local.conn = conn
+        return conn
 
     def _hash_key(self, key: str) -> str:
         """Generate hash for cache key."""
         return hashlib.sha256(key.encode("utf-8")).hexdigest()
 
-    def _get_cache_path(self, key: str) -> Path:
-        """Get cache file path for key."""
-        key_hash = self._hash_key(key)
-        return self.cache_dir / f"{key_hash}.json"
-
     def get(self, key: str) -> Optional[Any]:
         """
         Get value from cache.
@@ -33,13 +53,15 @@ class Cache:
         Returns:
             Cached value or None if not found
         """
-        cache_path = self._get_cache_path(key)
-        if not cache_path.exists():
-            return None
-
         try:
-            data = json.loads(cache_path.read_text(encoding="utf-8"))
-            return data.get("value")
+            row = (
+                self._connect()
+                .execute("SELECT value FROM cache WHERE key = ?", (self._hash_key(key),))
+                .fetchone()
+            )
+            if row is None:
+                return None
+            return serialization.loads(row[0])
         except Exception:
             return None
 
@@ -52,13 +74,16 @@ class Cache:
             value: Value to cache (must be JSON serializable)
             metadata: Optional metadata to store with cache entry
         """
-        cache_path = self._get_cache_path(key)
-        cache_data = {"value": value}
-        if metadata:
-            cache_data["metadata"] = metadata
-
         try:
-            cache_path.write_text(json.dumps(cache_data, indent=2), encoding="utf-8")
+            self._connect().execute(
+                "INSERT OR REPLACE INTO cache (key, value, metadata, ts) VALUES (?, ?, ?, ?)",
+                (
+                    self._hash_key(key),
+                    serialization.dumps_compact(value),
+                    serialization.dumps_compact(metadata) if metadata else None,
+                    time.time(),
+                ),
+            )
         except Exception:
             pass  # Silently fail on cache write errors
 
@@ -72,11 +97,8 @@ class Cache:
         Returns:
             True if deleted, False if not found
         """
-        cache_path = self._get_cache_path(key)
-        if cache_path.exists():
-            cache_path.unlink()
-            return True
-        return False
+        cursor = self._connect().execute("DELETE FROM cache WHERE key = ?", (self._hash_key(key),))
+        return cursor.rowcount > 0
 
     def clear(self) -> int:
         """
@@ -85,7 +107,8 @@ class Cache:
         Returns:
             Number of entries deleted
         """
-        deleted = 0
+        deleted = self._connect().execute("DELETE FROM cache").rowcount
+        # Entries written as one JSON file per key by earlier versions
         for cache_file in self.cache_dir.glob("*.json"):
             try:
                 cache_file.unlink()
@@ -1,10 +1,11 @@
 """Checkpoint system for saving and resuming pipeline execution."""
 
-import json
 from datetime import datetime
+from itertools import groupby
 from pathlib import Path
 from typing import Any, Optional
 
+from megaprompt.core import serialization
 from megaprompt.schemas.assembly import MegaPrompt
 from megaprompt.schemas.constraints import Constraints
 from megaprompt.schemas.decomposition import ProjectDecomposition
@@ -13,6 +14,11 @@ from megaprompt.schemas.intent import IntentExtraction
 from megaprompt.schemas.risk import RiskAnalysis
 
 
+def _file_stamp(checkpoint_file: Path) -> str:
+    """Return the YYYYMMDD_HHMMSS creation stamp at the end of a checkpoint file name."""
+    return checkpoint_file.stem[-15:]
+
+
 class Checkpoint:
     """Represents a checkpoint of pipeline execution."""
 
@@ -98,19 +104,19 @@ class Checkpoint:
         """Save checkpoint to file."""
         checkpoint_dir.mkdir(parents=True, exist_ok=True)
         checkpoint_file = checkpoint_dir / f"{self.checkpoint_id}.json"
-        checkpoint_file.write_text(
-            json.dumps(self.to_dict(), indent=2), encoding="utf-8"
-        )
+        # Kept indented: checkpoints are meant to be inspectable by hand
+        checkpoint_file.write_bytes(serialization.dumps_bytes(self.to_dict()))
         return checkpoint_file
 
 
 class CheckpointManager:
     """Manages checkpoints for pipeline execution."""
 
-    def __init__(self, checkpoint_dir: Path):
-        """Initialize checkpoint manager."""
+    def __init__(self, checkpoint_dir: Path, create_dir: bool = True):
+        """Initialize checkpoint manager (directory created unless create_dir is False)."""
         self.checkpoint_dir = checkpoint_dir
-        checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        if create_dir:
+            checkpoint_dir.mkdir(parents=True, exist_ok=True)
 
     def _hash_input(self, input_text: str) -> str:
         """Generate hash for input text."""
@@ -149,37 +155,43 @@ class CheckpointManager:
         checkpoint.save(self.checkpoint_dir)
         return checkpoint
 
+    def _load_checkpoint(self, checkpoint_file: Path) -> Optional[Checkpoint]:
+        """Load a checkpoint file, returning None if it cannot be read."""
+        try:
+            return Checkpoint.from_dict(serialization.loads(checkpoint_file.read_bytes()))
+        except Exception:
+            return None
+
     def find_latest_checkpoint(self, input_text: str) -> Optional[Checkpoint]:
         """Find the latest checkpoint for given input."""
         input_hash = self._hash_input(input_text)
 
-        # Find all checkpoints for this input
-        checkpoints = []
-        for checkpoint_file in self.checkpoint_dir.glob(f"{input_hash}_*.json"):
-            try:
-                data = json.loads(checkpoint_file.read_text(encoding="utf-8"))
-                checkpoint = Checkpoint.from_dict(data)
-                checkpoints.append(checkpoint)
-            except Exception:
-                continue
-
-        if not checkpoints:
-            return None
-
-        # Return the most recent checkpoint
-        return max(checkpoints, key=lambda c: c.timestamp)
+        # Checkpoint IDs end in a YYYYMMDD_HHMMSS stamp, so files sort by
+        # creation second without being read. Only the newest second's files
+        # are parsed (several stages can finish within one second); older
+        # ones are reached only if none of those load.
+        checkpoint_files = sorted(
+            self.checkpoint_dir.glob(f"{input_hash}_*.json"), key=_file_stamp, reverse=True
+        )
+        for _, same_second in groupby(checkpoint_files, key=_file_stamp):
+            checkpoints = [
+                checkpoint
+                for checkpoint in map(self._load_checkpoint, same_second)
+                if checkpoint is not None
+            ]
+            if checkpoints:
+                # Return the most recent checkpoint
+                return max(checkpoints, key=lambda c: c.timestamp)
+
+        return None
 
     def list_checkpoints(self) -> list[Checkpoint]:
         """List all checkpoints."""
-        checkpoints = []
-        for checkpoint_file in self.checkpoint_dir.glob("*.json"):
-            try:
-                data = json.loads(checkpoint_file.read_text(encoding="utf-8"))
-                checkpoint = Checkpoint.from_dict(data)
-                checkpoints.append(checkpoint)
-            except Exception:
-                continue
-
+        checkpoints = [
+            checkpoint
+            for checkpoint in map(self._load_checkpoint, self.checkpoint_dir.glob("*.json"))
+            if checkpoint is not None
+        ]
         return sorted(checkpoints, key=lambda c: c.timestamp, reverse=True)
 
     def delete_checkpoint(self, checkpoint_id: str) -> bool:
@@ -5,7 +5,7 @@ import os
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
+from megaprompt.core.serialization import dump_yaml, load_yaml
 
 
 class Config:
@@ -63,13 +63,14 @@ class Config:
     def _load_file(self, config_path: Path, config: "Config") -> None:
         """Load configuration from a YAML or JSON file."""
         try:
+            if config_path.suffix not in (".yaml", ".yml", ".json"):
+                return  # Skip unknown formats
+
             content = config_path.read_text(encoding="utf-8")
-            if config_path.suffix in [".yaml", ".yml"]:
-                data = yaml.safe_load(content)
-            elif config_path.suffix == ".json":
+            if config_path.suffix == ".json":
                 data = json.loads(content)
             else:
-                return  # Skip unknown formats
+                data = load_yaml(content)
 
             if not isinstance(data, dict):
                 return
@@ -116,7 +117,7 @@ class Config:
         data = {k: v for k, v in data.items() if v is not None}
 
         if format == "yaml":
-            content = yaml.dump(data, default_flow_style=False, sort_keys=False)
+            content = dump_yaml(data)
         else:
             content = json.dumps(data, indent=2)
 
@@ -15,6 +15,41 @@ except ImportError:
     JSON_LOGGER_AVAILABLE = False
 
 
+# Open log file handlers keyed by (resolved path, level, json_output). Each
+# handler is configured once when created, so loggers sharing one never
+# override each other's level or format.
+_file_handlers: dict[tuple[Path, "LogLevel", bool], logging.FileHandler] = {}
+
+
+def _make_formatter(json_output: bool) -> logging.Formatter:
+    """Create the log formatter for plain or JSON output."""
+    if json_output:
+        if JSON_LOGGER_AVAILABLE:
+            return jsonlogger.JsonFormatter(
+                "%(timestamp)s %(level)s %(name)s %(message)s",
+                timestamp=True,
+            )
+        # Fallback to custom JSON formatter if pythonjsonlogger not available
+        return JSONFormatter()
+    return logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+
+def _get_file_handler(log_file: Path, level: "LogLevel", json_output: bool) -> logging.FileHandler:
+    """Return the shared handler for a log file and settings, opening it on first use."""
+    key = (log_file.resolve(), level, json_output)
+    handler = _file_handlers.get(key)
+    if handler is None:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        handler = logging.FileHandler(log_file)
+        handler.setLevel(getattr(logging, level.value))
+        handler.setFormatter(_make_formatter(json_output))
+        _file_handlers[key] = handler
+    return handler
+
+
 class LogLevel(str, Enum):
     """Log level enumeration."""
 
@@ -94,35 +129,15 @@ class StructuredLogger:
         # Remove existing handlers
         self.logger.handlers.clear()
         
-        # Create formatter
-        if json_output:
-            if JSON_LOGGER_AVAILABLE:
-                formatter = jsonlogger.JsonFormatter(
-                    "%(timestamp)s %(level)s %(name)s %(message)s",
-                    timestamp=True,
-                )
-            else:
-                # Fallback to custom JSON formatter if pythonjsonlogger not available
-                formatter = JSONFormatter()
-        else:
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
-        
         # Console handler
         console_handler = logging.StreamHandler(sys.stderr)
         console_handler.setLevel(getattr(logging, level.value))
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_make_formatter(json_output))
         self.logger.addHandler(console_handler)
         
         # File handler (if specified)
         if log_file:
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setLevel(getattr(logging, level.value))
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            self.logger.addHandler(_get_file_handler(log_file, level, json_output))
     
     def _log_with_context(
         self,
@@ -302,6 +317,9 @@ class StructuredLogger:
 # Global logger instance
 _default_logger: Optional[StructuredLogger] = None
 
+# Settings of the last configure_logging() call, to skip identical repeats
+_last_configuration: Optional[tuple[str, bool, Optional[str]]] = None
+
 
 def get_logger(
     name: str = "megaprompt",
@@ -339,24 +357,11 @@ def get_logger(
             _default_logger.json_output = json_output
         if log_file is not None and _default_logger.log_file != log_file:
             # Add file handler if different file specified
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setLevel(getattr(logging, _default_logger.level.value))
-            if _default_logger.json_output:
-                if JSON_LOGGER_AVAILABLE:
-                    formatter = jsonlogger.JsonFormatter(
-                        "%(timestamp)s %(level)s %(name)s %(message)s",
-                        timestamp=True,
-                    )
-                else:
-                    formatter = JSONFormatter()
-            else:
-                formatter = logging.Formatter(
-                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                    datefmt="%Y-%m-%d %H:%M:%S",
-                )
-            file_handler.setFormatter(formatter)
-            _default_logger.logger.addHandler(file_handler)
+            file_handler = _get_file_handler(
+                log_file, _default_logger.level, _default_logger.json_output
+            )
+            if file_handler not in _default_logger.logger.handlers:
+                _default_logger.logger.addHandler(file_handler)
             _default_logger.log_file = log_file
     
     return _default_logger
@@ -378,12 +383,20 @@ def configure_logging(
     Returns:
         Configured StructuredLogger instance
     """
+    global _last_configuration
+
+    configuration = (level.upper(), json_output, log_file)
+    if _default_logger is not None and configuration == _last_configuration:
+        return _default_logger
+
     log_level = LogLevel[level.upper()]
     log_path = Path(log_file) if log_file else None
     
-    return get_logger(
+    logger = get_logger(
         level=log_level,
         json_output=json_output,
         log_file=log_path,
     )
+    _last_configuration = configuration
+    return logger
 
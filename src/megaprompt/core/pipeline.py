@@ -38,6 +38,7 @@ class MegaPromptPipeline:
         checkpoint_dir: Optional[Path] = None,
         cache_dir: Optional[Path] = None,
         use_cache: bool = True,
+        create_dirs: bool = True,
     ):
         """
         Initialize pipeline.
@@ -52,6 +53,8 @@ class MegaPromptPipeline:
             checkpoint_dir: Directory for checkpoints (None to disable)
             cache_dir: Directory for cache (None to disable)
             use_cache: Whether to use caching
+            create_dirs: Whether to create checkpoint/cache directories
+                (False when the caller has already created them)
         """
         self.provider = provider
         self.model = model
@@ -89,11 +92,11 @@ class MegaPromptPipeline:
         # Initialize checkpoint and cache managers
         self.checkpoint_manager: Optional[CheckpointManager] = None
         if checkpoint_dir:
-            self.checkpoint_manager = CheckpointManager(checkpoint_dir)
+            self.checkpoint_manager = CheckpointManager(checkpoint_dir, create_dir=create_dirs)
 
         self.cache: Optional[Cache] = None
         if use_cache and cache_dir:
-            self.cache = Cache(cache_dir)
+            self.cache = Cache(cache_dir, create_dir=create_dirs)
 
         # Initialize progress indicator
         self.progress = ProgressIndicator(enabled=True)
@@ -0,0 +1,142 @@
+"""Serialization helpers with optional C acceleration (orjson, libyaml)."""
+
+import io
+import json
+from typing import IO, Any, Callable, Optional
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_bytes(data: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Serialize data to indented UTF-8 JSON bytes.
+
+    Args:
+        data: JSON-compatible data
+        default: Fallback converter for objects the encoder cannot handle
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=default).encode("utf-8")
+
+
+def dumps(data: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Serialize data to an indented JSON string.
+
+    Args:
+        data: JSON-compatible data
+        default: Fallback converter for objects the encoder cannot handle
+
+    Returns:
+        JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return dumps_bytes(data, default).decode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False, default=default)
+
+
+def dumps_compact(data: Any) -> bytes:
+    """
+    Serialize data to compact UTF-8 JSON bytes, for machine-read storage.
+
+    Args:
+        data: JSON-compatible data
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: UTF-8 JSON bytes or text
+
+    Returns:
+        Parsed data
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump(data: Any, fp: IO[bytes]) -> None:
+    """
+    Write indented JSON to a binary file object.
+
+    Without orjson, the stdlib encoder streams chunks into the file instead
+    of building the whole document in memory first.
+
+    Args:
+        data: JSON-compatible data
+        fp: Binary file object opened for writing
+    """
+    if ORJSON_AVAILABLE:
+        fp.write(dumps_bytes(data))
+        return
+    text_stream = io.TextIOWrapper(fp, encoding="utf-8", write_through=True)
+    json.dump(data, text_stream, indent=2, ensure_ascii=False)
+    text_stream.detach()
+
+
+def dump_yaml(data: Any, sort_keys: bool = False) -> str:
+    """
+    Serialize data to block-style YAML.
+
+    Args:
+        data: YAML-compatible data
+        sort_keys: Whether to sort mapping keys
+
+    Returns:
+        YAML document
+    """
+    import yaml
+
+    # Prefer the libyaml bindings; PyYAML may be built without them
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml.dump(data, Dumper=dumper, default_flow_style=False, sort_keys=sort_keys)
+
+
+def dump_yaml_to(data: Any, fp: IO[bytes], sort_keys: bool = False) -> None:
+    """
+    Write block-style YAML to a binary file object as it is emitted.
+
+    Args:
+        data: YAML-compatible data
+        fp: Binary file object opened for writing
+        sort_keys: Whether to sort mapping keys
+    """
+    import yaml
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    yaml.dump(data, fp, Dumper=dumper, encoding="utf-8", default_flow_style=False, sort_keys=sort_keys)
+
+
+def load_yaml(content: str) -> Any:
+    """
+    Parse a YAML document with the safe loader.
+
+    Args:
+        content: YAML text
+
+    Returns:
+        Parsed data
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(content, Loader=loader)
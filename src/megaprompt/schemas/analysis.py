@@ -147,6 +147,15 @@ class SystemHoles(BaseModel):
     present: list[str] = Field(default_factory=list, description="System names that are present")
 
 
+class MissingSystemsExport(BaseModel):
+    """Missing and partial systems exported for prompt augmentation (--augment)."""
+
+    missing_systems: list[SystemGap] = Field(default_factory=list, description="Missing systems")
+    partial_systems: list[SystemGap] = Field(
+        default_factory=list, description="Partially implemented systems"
+    )
+
+
 class Enhancement(BaseModel):
     """A suggested enhancement for the codebase."""
 
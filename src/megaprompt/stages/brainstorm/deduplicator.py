@@ -1,5 +1,7 @@
 """Deduplication stage implementation."""
 
+from functools import lru_cache
+
 from megaprompt.schemas.brainstorm import ProjectIdea
 
 
@@ -29,25 +31,42 @@ class Deduplicator:
             return ideas
 
         unique_ideas: list[ProjectIdea] = []
-        seen_signatures: set[str] = set()
+        seen_word_sets: list[frozenset[str]] = []
 
         for idea in ideas:
-            signature = self._create_signature(idea)
-            
-            # Check if we've seen a similar signature
-            is_duplicate = False
-            for seen_sig in seen_signatures:
-                similarity = self._calculate_similarity(signature, seen_sig)
-                if similarity >= self.similarity_threshold:
-                    is_duplicate = True
-                    break
-
-            if not is_duplicate:
+            words = _signature_words(self._create_signature(idea))
+
+            # Keep the idea unless it is too similar to one already kept
+            if not any(
+                self._calculate_similarity(words, seen) >= self.similarity_threshold
+                for seen in seen_word_sets
+            ):
                 unique_ideas.append(idea)
-                seen_signatures.add(signature)
+                seen_word_sets.append(words)
 
         return unique_ideas
 
+    def is_duplicate(self, idea: ProjectIdea, existing_ideas: list[ProjectIdea]) -> bool:
+        """
+        Check whether an idea is too similar to any idea in an already deduplicated list.
+
+        Equivalent to appending the idea and deduplicating the whole list
+        again, but compares only the new idea, stopping at the first match.
+
+        Args:
+            idea: Candidate idea
+            existing_ideas: Ideas already deduplicated
+
+        Returns:
+            True if the idea would be removed as a duplicate
+        """
+        words = _signature_words(self._create_signature(idea))
+        return any(
+            self._calculate_similarity(words, _signature_words(self._create_signature(existing)))
+            >= self.similarity_threshold
+            for existing in existing_ideas
+        )
+
     def _create_signature(self, idea: ProjectIdea) -> str:
         """
         Create a signature string for an idea based on core characteristics.
@@ -69,21 +88,17 @@ class Deduplicator:
         
         return signature
 
-    def _calculate_similarity(self, sig1: str, sig2: str) -> float:
+    def _calculate_similarity(self, words1: frozenset[str], words2: frozenset[str]) -> float:
         """
-        Calculate similarity between two signatures.
+        Calculate similarity between the word sets of two signatures.
 
         Args:
-            sig1: First signature
-            sig2: Second signature
+            words1: Words of the first signature
+            words2: Words of the second signature
 
         Returns:
             Similarity score (0.0-1.0)
         """
-        # Simple word overlap similarity
-        words1 = set(sig1.split())
-        words2 = set(sig2.split())
-
         if not words1 or not words2:
             return 0.0
 
@@ -96,3 +111,9 @@ class Deduplicator:
 
         return intersection / union
 
+
+@lru_cache(maxsize=1024)
+def _signature_words(signature: str) -> frozenset[str]:
+    """Split a signature into its word set, once per distinct signature."""
+    # Simple word overlap similarity
+    return frozenset(signature.split())
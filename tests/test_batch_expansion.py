@@ -0,0 +1,99 @@
+"""Tests for batch input pattern expansion."""
+
+import glob
+import os
+from pathlib import Path
+
+import pytest
+
+from megaprompt.cli.main import _expand_pattern
+
+# Files of the test tree, relative to its root
+TREE = [
+    "top.txt",
+    "in/a.txt",
+    "in/b.md",
+    "in/.hidden.txt",
+    "in/p[1].txt",
+    "in/sub/c.txt",
+    "in/sub/deep/d.txt",
+    "in/sub2/f.txt",
+    "in/.git/e.txt",
+    "in/.git/objects/g.txt",
+]
+
+PATTERNS = [
+    "in/*.txt",
+    "in/*",
+    "in/.*",
+    "in/?.txt",
+    "in/[ab].*",
+    "in/[!a].txt",
+    "in/p[[]1].txt",
+    "in/*/*.txt",
+    "in/.*/*.txt",
+    "in/**",
+    "in/**/*.txt",
+    "**/*.txt",
+    "in/**/deep/*.txt",
+    "in/sub*/**/*.txt",
+    "in/**/.*",
+    "in/*/",
+    "in/**/",
+    "in//*.txt",
+    "missing/*.txt",
+    "in/*.none",
+]
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    """Create the test tree and make it the working directory."""
+    for relative in TREE:
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(relative, encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _glob_files(pattern: str) -> set[str]:
+    """Files matched by the stdlib's recursive glob."""
+    return {os.path.normpath(f) for f in glob.glob(pattern, recursive=True) if os.path.isfile(f)}
+
+
+def _expanded_files(pattern: str) -> set[str]:
+    """Files matched by _expand_pattern."""
+    return {os.path.normpath(path) for path, _ in _expand_pattern(pattern)}
+
+
+class TestExpandPattern:
+    """Tests for _expand_pattern."""
+
+    @pytest.mark.parametrize("pattern", PATTERNS)
+    def test_matches_glob_relative(self, tree, pattern):
+        """Relative patterns match the same files as glob.glob(recursive=True)."""
+        assert _expanded_files(pattern) == _glob_files(pattern)
+
+    @pytest.mark.parametrize("pattern", PATTERNS)
+    def test_matches_glob_absolute(self, tree, pattern):
+        """Absolute patterns match the same files as glob.glob(recursive=True)."""
+        absolute = os.path.join(str(tree), pattern)
+        assert _expanded_files(absolute) == _glob_files(absolute)
+
+    def test_reports_file_sizes(self, tree):
+        """Each match carries its size in bytes."""
+        assert _expand_pattern("in/sub/deep/*.txt") == [
+            (Path("in/sub/deep/d.txt"), len("in/sub/deep/d.txt"))
+        ]
+
+    def test_literal_file(self, tree):
+        """A pattern without wildcards names a single file."""
+        assert _expanded_files("in/a.txt") == {os.path.normpath("in/a.txt")}
+        assert _expanded_files("in/nope.txt") == set()
+
+    def test_directory_expands_to_its_files(self, tree):
+        """A directory stands for the non-hidden files directly inside it."""
+        expected = {os.path.normpath(p) for p in ("in/a.txt", "in/b.md", "in/p[1].txt")}
+        assert _expanded_files("in") == expected
+        assert _expanded_files("in/") == expected
@@ -0,0 +1,147 @@
+"""Tests for the brainstorm pipeline."""
+
+from unittest.mock import patch
+
+import pytest
+
+from megaprompt.core.brainstorm_pipeline import BrainstormPipeline
+from megaprompt.schemas.brainstorm import (
+    ConceptCluster,
+    ConceptClusters,
+    IdeaSpaceExpansion,
+    ProjectIdea,
+)
+
+
+def _make_idea(name: str) -> ProjectIdea:
+    """Build a valid idea whose signature is unique to its name."""
+    return ProjectIdea(
+        name=name,
+        tagline=f"Tagline for {name}",
+        core_loop=[f"{name}-explore", f"{name}-build", f"{name}-share"],
+        key_systems=[f"{name}-engine", f"{name}-store"],
+        unique_twist=f"{name}-twist",
+        technical_challenge="Keeping state consistent",
+        feasibility="medium",
+        why_it_exists=f"Because {name} matters",
+        potential_failures=[],
+        estimated_scope="small",
+    )
+
+
+def _make_pipeline(cache_dir, temperature=0.7, seed=None, max_parallel_requests=None):
+    """Create a pipeline whose stages are stubbed and count their calls."""
+    with patch("megaprompt.core.brainstorm_pipeline.create_client", return_value=object()), patch(
+        "megaprompt.core.llm_wrapper.wrap_client_with_logging",
+        side_effect=lambda client, **kwargs: client,
+    ):
+        pipeline = BrainstormPipeline(
+            provider="ollama",
+            temperature=temperature,
+            seed=seed,
+            cache_dir=cache_dir,
+            max_parallel_requests=max_parallel_requests,
+        )
+
+    calls = {"count": 0}
+    names = iter(f"idea{i}" for i in range(1000))
+
+    def counted(fn):
+        def wrapper(*args, **kwargs):
+            calls["count"] += 1
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    pipeline.idea_space_expander.expand = counted(
+        lambda seed_prompt, domain=None: IdeaSpaceExpansion(
+            axes=["scale", "audience", "platform"], rationale="Stub expansion"
+        )
+    )
+    pipeline.concept_clusterer.cluster = counted(
+        lambda idea_space, target_count=8, domain=None: ConceptClusters(
+            clusters=[
+                ConceptCluster(
+                    name=f"cluster{i}",
+                    description="Stub cluster",
+                    axis_combination=["scale", "audience"],
+                )
+                for i in range(3)
+            ]
+        )
+    )
+    pipeline.idea_synthesizer.synthesize = counted(lambda cluster, **kwargs: _make_idea(next(names)))
+    pipeline.quality_enforcer.enforce = counted(lambda idea: ("accepted", idea, None))
+    pipeline.self_critique_injector.inject = counted(
+        lambda idea: idea.model_copy(update={"potential_failures": ["scope creep", "latency"]})
+    )
+    return pipeline, calls
+
+
+class TestBrainstormCache:
+    """Tests for brainstorm stage caching."""
+
+    @pytest.mark.parametrize("settings", [{"seed": 1}, {"temperature": 0}])
+    def test_same_deterministic_settings_hit_cache(self, tmp_path, settings):
+        """A seeded or greedy rerun with identical settings makes no stage calls."""
+        first, first_calls = _make_pipeline(tmp_path, **settings)
+        first_result = first.brainstorm("seed idea", count=3)
+        assert first_calls["count"] > 0
+
+        second, second_calls = _make_pipeline(tmp_path, **settings)
+        second_result = second.brainstorm("seed idea", count=3)
+        assert second_calls["count"] == 0
+        assert sorted(i.name for i in second_result.ideas) == sorted(
+            i.name for i in first_result.ideas
+        )
+
+    @pytest.mark.parametrize("settings", [{"temperature": 0.2, "seed": 1}, {"seed": 42}])
+    def test_different_sampling_settings_miss_cache(self, tmp_path, settings):
+        """Changing temperature or seed regenerates every stage."""
+        first, first_calls = _make_pipeline(tmp_path, seed=1)
+        first.brainstorm("seed idea", count=3)
+
+        second, second_calls = _make_pipeline(tmp_path, **settings)
+        second.brainstorm("seed idea", count=3)
+        assert second_calls["count"] == first_calls["count"]
+
+    def test_sampled_runs_are_not_cached(self, tmp_path):
+        """Without a seed and at temperature > 0, every run reaches the LLM."""
+        first, first_calls = _make_pipeline(tmp_path, temperature=0.7, seed=None)
+        first.brainstorm("seed idea", count=3)
+        assert first.cache is None
+
+        second, second_calls = _make_pipeline(tmp_path, temperature=0.7, seed=None)
+        second.brainstorm("seed idea", count=3)
+        assert second_calls["count"] == first_calls["count"] > 0
+        assert not (tmp_path / "cache.db").exists()
+
+
+class TestMaxParallelRequests:
+    """Tests for the concurrent request limit."""
+
+    @pytest.mark.parametrize("value, expected", [(4, 4), (0, None), (-3, 1)])
+    def test_argument_is_at_least_one(self, tmp_path, monkeypatch, value, expected):
+        """Explicit limits are clamped to 1; 0 falls back to the default."""
+        monkeypatch.delenv("MEGAPROMPT_MAX_PARALLEL", raising=False)
+        pipeline, _ = _make_pipeline(tmp_path, max_parallel_requests=value)
+        if expected is None:
+            assert pipeline.max_parallel_requests >= 32
+        else:
+            assert pipeline.max_parallel_requests == expected
+
+    @pytest.mark.parametrize("value, expected", [("6", 6), ("0", 1), ("-2", 1), ("many", None)])
+    def test_environment_variable(self, tmp_path, monkeypatch, value, expected):
+        """MEGAPROMPT_MAX_PARALLEL is clamped to 1 and ignored if not an integer."""
+        monkeypatch.setenv("MEGAPROMPT_MAX_PARALLEL", value)
+        pipeline, _ = _make_pipeline(tmp_path)
+        if expected is None:
+            assert pipeline.max_parallel_requests >= 32
+        else:
+            assert pipeline.max_parallel_requests == expected
+
+    def test_clamped_limit_still_brainstorms(self, tmp_path, monkeypatch):
+        """A limit clamped to 1 runs the stages without a thread pool error."""
+        monkeypatch.setenv("MEGAPROMPT_MAX_PARALLEL", "0")
+        pipeline, _ = _make_pipeline(tmp_path)
+        assert len(pipeline.brainstorm("seed idea", count=3).ideas) == 3
@@ -0,0 +1,71 @@
+"""Tests for the pipeline result cache."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from megaprompt.core.cache import Cache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary directory."""
+    return Cache(tmp_path / "cache")
+
+
+class TestCache:
+    """Tests for Cache."""
+
+    def test_get_missing_returns_none(self, cache):
+        """Unknown keys are cache misses."""
+        assert cache.get("missing") is None
+
+    def test_set_get_round_trip(self, cache):
+        """Stored values come back unchanged."""
+        key = cache.get_cache_key("intent", {"prompt": "héllo", "n": [1, 2]}, "ollama", "llama3.1")
+        value = {"core_goal": "Build a sim ü", "items": [1, 2.5, None, True], "nested": {"a": []}}
+        cache.set(key, value, metadata={"ts": 1.0})
+        assert cache.get(key) == value
+
+    def test_set_overwrites(self, cache):
+        """Setting an existing key replaces its value."""
+        cache.set("key", {"v": 1})
+        cache.set("key", {"v": 2})
+        assert cache.get("key") == {"v": 2}
+
+    def test_persists_across_instances(self, tmp_path):
+        """A new Cache on the same directory sees earlier entries."""
+        Cache(tmp_path).set("key", [1, 2, 3])
+        assert Cache(tmp_path).get("key") == [1, 2, 3]
+
+    def test_delete(self, cache):
+        """delete reports whether an entry was removed."""
+        cache.set("key", "value")
+        assert cache.delete("key") is True
+        assert cache.get("key") is None
+        assert cache.delete("key") is False
+
+    def test_clear_counts_rows_and_legacy_files(self, cache):
+        """clear removes database rows and per-key JSON files from older versions."""
+        for i in range(3):
+            cache.set(f"key{i}", i)
+        for i in range(2):
+            (cache.cache_dir / f"legacy{i}.json").write_text('{"value": 1}', encoding="utf-8")
+
+        assert cache.clear() == 5
+        assert cache.get("key0") is None
+        assert list(cache.cache_dir.glob("*.json")) == []
+        assert cache.clear() == 0
+
+    def test_concurrent_threads(self, cache):
+        """One Cache can be shared by worker threads."""
+
+        def store_and_load(i: int) -> int:
+            cache.set(f"key{i}", {"i": i})
+            return cache.get(f"key{i}")["i"]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(store_and_load, range(200)))
+
+        assert results == list(range(200))
+        assert all(cache.get(f"key{i}") == {"i": i} for i in range(200))
@@ -0,0 +1,77 @@
+"""Tests for pipeline checkpoints."""
+
+from datetime import datetime
+
+import pytest
+
+from megaprompt.core.checkpoint import Checkpoint, CheckpointManager
+
+PROMPT = "Build a civilization simulator"
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a checkpoint manager in a temporary directory."""
+    return CheckpointManager(tmp_path)
+
+
+def _save(manager: CheckpointManager, stage: str, timestamp: datetime, input_text: str = PROMPT):
+    """Save a checkpoint with an ID stamped like create_checkpoint's."""
+    input_hash = manager._hash_input(input_text)
+    checkpoint = Checkpoint(
+        checkpoint_id=f"{input_hash}_{stage}_{timestamp.strftime('%Y%m%d_%H%M%S')}",
+        timestamp=timestamp,
+        input_hash=input_hash,
+        stage=stage,
+    )
+    return checkpoint.save(manager.checkpoint_dir)
+
+
+class TestFindLatestCheckpoint:
+    """Tests for CheckpointManager.find_latest_checkpoint."""
+
+    def test_no_checkpoints(self, manager):
+        """Inputs without checkpoints find nothing."""
+        _save(manager, "intent", datetime(2026, 1, 1, 12, 0, 0), input_text="another prompt")
+        assert manager.find_latest_checkpoint(PROMPT) is None
+
+    def test_same_second_uses_stored_timestamp(self, manager):
+        """Within one second, the full stored timestamp picks the latest."""
+        _save(manager, "intent", datetime(2026, 1, 1, 12, 0, 0, 100))
+        _save(manager, "risk_analysis", datetime(2026, 1, 1, 12, 0, 0, 900))
+        _save(manager, "decomposition", datetime(2026, 1, 1, 12, 0, 0, 500))
+
+        assert manager.find_latest_checkpoint(PROMPT).stage == "risk_analysis"
+
+    def test_newest_second_wins_over_older_seconds(self, manager):
+        """Checkpoints from earlier seconds lose to the newest one."""
+        _save(manager, "intent", datetime(2026, 1, 1, 11, 59, 58))
+        _save(manager, "decomposition", datetime(2026, 1, 1, 11, 59, 59, 999999))
+        _save(manager, "expansion", datetime(2026, 1, 1, 12, 0, 0))
+
+        assert manager.find_latest_checkpoint(PROMPT).stage == "expansion"
+
+    def test_unreadable_newest_falls_back_to_older_second(self, manager):
+        """If no checkpoint of the newest second loads, the next second is used."""
+        _save(manager, "intent", datetime(2026, 1, 1, 11, 59, 58))
+        _save(manager, "decomposition", datetime(2026, 1, 1, 11, 59, 59))
+        newest = _save(manager, "expansion", datetime(2026, 1, 1, 12, 0, 0))
+        newest.write_text("{not json", encoding="utf-8")
+
+        assert manager.find_latest_checkpoint(PROMPT).stage == "decomposition"
+
+    def test_unreadable_file_within_newest_second_is_skipped(self, manager):
+        """A corrupt file does not hide readable checkpoints from the same second."""
+        _save(manager, "intent", datetime(2026, 1, 1, 12, 0, 0, 100))
+        broken = _save(manager, "decomposition", datetime(2026, 1, 1, 12, 0, 0, 900))
+        broken.write_text("{not json", encoding="utf-8")
+
+        assert manager.find_latest_checkpoint(PROMPT).stage == "intent"
+
+    def test_round_trip_through_create_checkpoint(self, manager):
+        """Checkpoints written by create_checkpoint are found again."""
+        manager.create_checkpoint(PROMPT, "intent", error="boom é")
+        latest = manager.find_latest_checkpoint(PROMPT)
+        assert latest.stage == "intent"
+        assert latest.error == "boom é"
+        assert [c.stage for c in manager.list_checkpoints()] == ["intent"]
@@ -0,0 +1,157 @@
+"""Tests for CLI helpers."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from megaprompt.cli.formatters import OutputFormatter
+from megaprompt.cli.main import _live_progress_enabled, main
+
+
+class _StubPipeline:
+    """Pipeline stand-in that echoes the prompt back without calling an LLM."""
+
+    def __init__(self, **kwargs):
+        pass
+
+    def generate(self, user_prompt, verbose=False, resume=False):
+        return f"# Mega-prompt\n\n{user_prompt.strip()}", {}
+
+
+class _TTYStream(io.StringIO):
+    """In-memory stream that reports itself as a terminal."""
+
+    def isatty(self) -> bool:
+        return True
+
+
+class TestLiveProgress:
+    """Tests for choosing the live batch progress bar."""
+
+    @pytest.mark.parametrize(
+        "stdout_cls, color, expected",
+        [
+            (_TTYStream, None, True),  # real terminal, auto-detect
+            (_TTYStream, False, False),  # --no-color on a terminal
+            (io.StringIO, None, False),  # piped output
+            (io.StringIO, True, False),  # --color into a pipe or file
+        ],
+    )
+    def test_live_progress_requires_terminal(self, stdout_cls, color, expected):
+        """The bar is drawn only when stdout really is a terminal."""
+        with patch("sys.stdout", stdout_cls()):
+            formatter = OutputFormatter(use_rich=True, force_color=color)
+            assert _live_progress_enabled(formatter, verbose=True) is expected
+
+    def test_live_progress_requires_verbose(self):
+        """Non-verbose batches never show progress."""
+        with patch("sys.stdout", _TTYStream()):
+            formatter = OutputFormatter(use_rich=True, force_color=None)
+            assert _live_progress_enabled(formatter, verbose=False) is False
+
+
+class TestPrintInfoLines:
+    """Tests for writing blocks of info messages."""
+
+    @pytest.mark.parametrize("use_rich", [True, False])
+    def test_every_line_is_prefixed(self, use_rich):
+        """Each message in a block gets its own info icon."""
+        with patch("sys.stdout", io.StringIO()) as stdout:
+            formatter = OutputFormatter(use_rich=use_rich, force_color=False)
+            formatter.print_info_lines(["[1/3] ✓ a.txt", "[2/3] ✓ b.txt", "[3/3] ✗ c.txt"])
+            assert stdout.getvalue().splitlines() == [
+                "ℹ [1/3] ✓ a.txt",
+                "ℹ [2/3] ✓ b.txt",
+                "ℹ [3/3] ✗ c.txt",
+            ]
+
+
+class TestGenerateInput:
+    """Tests for how generate interprets INPUT_SOURCE."""
+
+    def test_existing_file_with_bracket_is_read_literally(self, tmp_path):
+        """A real file whose name looks like a glob is not sent to batch mode."""
+        input_file = tmp_path / "p[1].txt"
+        input_file.write_text("Build a todo app", encoding="utf-8")
+        output_file = tmp_path / "out.md"
+
+        with patch("megaprompt.core.pipeline.MegaPromptPipeline", _StubPipeline):
+            result = CliRunner().invoke(
+                main,
+                ["generate", str(input_file), "-o", str(output_file), "--no-cache", "--no-stats"],
+            )
+
+        assert result.exit_code == 0, result.output
+        assert "Build a todo app" in output_file.read_text(encoding="utf-8")
+
+    def test_from_idea_reads_brainstorm_json(self, tmp_path):
+        """--from-idea builds the prompt from the chosen idea of a brainstorm file."""
+        from megaprompt.schemas.brainstorm import BrainstormResult, ProjectIdea
+
+        idea = ProjectIdea(
+            name="Tide Garden",
+            tagline="Grow reefs against the tide",
+            core_loop=["plant", "tend", "harvest"],
+            key_systems=["currents", "growth"],
+            unique_twist="Tides rewrite the map",
+            technical_challenge="Fluid simulation",
+            feasibility="medium",
+            why_it_exists="Calm strategy",
+            potential_failures=[],
+            estimated_scope="small",
+        )
+        idea_file = tmp_path / "ideas.json"
+        idea_file.write_text(
+            BrainstormResult(seed_prompt="ocean game", ideas=[idea]).model_dump_json(),
+            encoding="utf-8",
+        )
+        output_file = tmp_path / "out.md"
+
+        with patch("megaprompt.core.pipeline.MegaPromptPipeline", _StubPipeline):
+            result = CliRunner().invoke(
+                main,
+                [
+                    "generate", "-", "--from-idea", "1", "--idea-file", str(idea_file),
+                    "-o", str(output_file), "--no-stats",
+                    "--cache-dir", str(tmp_path / "cache"),
+                ],
+            )
+
+        assert result.exit_code == 0, result.output
+        assert "Tide Garden" in output_file.read_text(encoding="utf-8")
+        assert not (tmp_path / "cache" / "json").exists()
+
+    def test_augment_reads_missing_systems_json(self, tmp_path):
+        """--augment appends the exported missing systems to the prompt."""
+        input_file = tmp_path / "idea.txt"
+        input_file.write_text("Build a todo app", encoding="utf-8")
+        augment_file = tmp_path / "missing.json"
+        augment_file.write_text(
+            json.dumps(
+                {
+                    "missing_systems": [
+                        {"system": "Authentication", "category": "security", "priority": "high"}
+                    ],
+                    "partial_systems": [],
+                }
+            ),
+            encoding="utf-8",
+        )
+        output_file = tmp_path / "out.md"
+
+        with patch("megaprompt.core.pipeline.MegaPromptPipeline", _StubPipeline):
+            result = CliRunner().invoke(
+                main,
+                [
+                    "generate", str(input_file), "--augment", str(augment_file),
+                    "-o", str(output_file), "--no-cache", "--no-stats",
+                ],
+            )
+
+        assert result.exit_code == 0, result.output
+        output_text = output_file.read_text(encoding="utf-8")
+        assert "Missing Systems Analysis" in output_text
+        assert "**Authentication** (security category, high priority)" in output_text
@@ -0,0 +1,48 @@
+"""Tests for structured logging."""
+
+import json
+import logging
+
+from megaprompt.core.logging import LogLevel, StructuredLogger
+
+
+def _file_handlers(logger: StructuredLogger) -> list[logging.FileHandler]:
+    """File handlers attached to a structured logger."""
+    return [h for h in logger.logger.handlers if isinstance(h, logging.FileHandler)]
+
+
+class TestFileHandlers:
+    """Tests for sharing log file handlers between loggers."""
+
+    def test_same_settings_share_handler(self, tmp_path):
+        """Loggers with the same file and settings reuse one handler."""
+        log_file = tmp_path / "shared.log"
+        first = StructuredLogger("test.share.a", level=LogLevel.INFO, log_file=log_file)
+        second = StructuredLogger("test.share.b", level=LogLevel.INFO, log_file=log_file)
+        assert _file_handlers(first) == _file_handlers(second)
+
+    def test_different_settings_keep_their_own_configuration(self, tmp_path):
+        """A later logger on the same file does not change an earlier one's level or format."""
+        log_file = tmp_path / "mixed.log"
+        plain = StructuredLogger("test.mixed.plain", level=LogLevel.WARNING, log_file=log_file)
+        structured = StructuredLogger(
+            "test.mixed.json", level=LogLevel.DEBUG, json_output=True, log_file=log_file
+        )
+
+        (plain_handler,) = _file_handlers(plain)
+        (json_handler,) = _file_handlers(structured)
+        assert plain_handler is not json_handler
+        assert plain_handler.level == logging.WARNING
+        assert json_handler.level == logging.DEBUG
+
+        plain.info("hidden")
+        plain.warning("plain warning")
+        structured.debug("json debug")
+        plain_handler.flush()
+        json_handler.flush()
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert not any("hidden" in line for line in lines)
+        assert any(line.endswith("WARNING - plain warning") for line in lines)
+        json_lines = [json.loads(line) for line in lines if line.startswith("{")]
+        assert any(record.get("message") == "json debug" for record in json_lines)